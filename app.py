@@ -9,24 +9,73 @@ Usage:
     python app.py --analyze <addr>  # Analyze specific address
 """
 
-from src.utils import DataValidator
-from src.utils import LogManager
-from src.api import create_app
-from src.chainbreak import ChainBreak
 import argparse
+import atexit
+import queue
 import sys
 import logging
+import logging.config
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 
 logger = logging.getLogger(__name__)
 
+LOG_CFG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        }
+    },
+    'handlers': {
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': 'chainbreak.log',
+            'maxBytes': 100 * 1024 * 1024,
+            'backupCount': 5,
+            'formatter': 'standard'
+        },
+        'stream': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'standard'
+        }
+    },
+    'root': {
+        'level': 'INFO',
+        'handlers': ['file', 'stream']
+    }
+}
+
+
+def setup_background_logging() -> QueueListener:
+    """Move log writes off the calling thread.
+
+    The root handlers configured by LOG_CFG are handed to a QueueListener
+    thread; the root logger only enqueues records, so analysis code never
+    blocks on chainbreak.log disk writes.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush queued records on interpreter exit
+    atexit.register(listener.stop)
+    return listener
+
 
 def run_standalone_analysis(address: str = None):
     """Run standalone ChainBreak analysis"""
+    # Heavy subsystems (Neo4j driver, pandas, ML) are only loaded when needed
+    from src.chainbreak import ChainBreak
+    from src.utils import AnalysisResultCache, DataValidator
+
     try:
         print("🔗 ChainBreak - Blockchain Forensic Analysis Tool")
         print("=" * 60)
@@ -60,12 +109,27 @@ def run_standalone_analysis(address: str = None):
         print(f"\n🚀 Starting analysis of address: {address}")
         print("This may take several minutes depending on transaction volume...")
 
-        results = chainbreak.analyze_address(
-            address, generate_visualizations=True)
+        cache_config = chainbreak.config.get('cache', {})
+        cache = AnalysisResultCache(
+            cache_config.get('redis_url', 'redis://localhost:6379/0'),
+            cache_config.get('ttl_seconds', 3600))
 
-        if 'error' in results:
-            print(f"❌ Analysis failed: {results['error']}")
-            return
+        results = cache.get(address, 'btc')
+        if results is not None:
+            print("⚡ Using cached analysis results")
+        else:
+            results = chainbreak.analyze_address(
+                address, generate_visualizations=False)
+
+            if 'error' in results:
+                print(f"❌ Analysis failed: {results['error']}")
+                return
+
+            # Only the analysis payload is cached; charts are regenerated below
+            results.pop('visualizations', None)
+            cache.set(address, 'btc', results)
+
+        results['visualizations'] = chainbreak.create_visualizations(address)
 
         # Display results
         print("\n✅ Analysis completed successfully!")
@@ -111,6 +175,8 @@ def run_standalone_analysis(address: str = None):
 
 def run_api_server(port: int = 5001):
     """Start the Flask API server"""
+    from src.api import create_app
+
     try:
         print("🔗 Starting ChainBreak API Server...")
         print("=" * 50)
@@ -137,8 +203,8 @@ def run_api_server(port: int = 5001):
         logger.error(f"API server error: {str(e)}")
 
 
-def main():
-    """Main application entry point"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(
         description="ChainBreak - Blockchain Forensic Analysis Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -183,19 +249,25 @@ Examples:
         help='Port to run the API server on (default: 5001)'
     )
 
-    args = parser.parse_args()
-
-    # Setup logging
-    LogManager()
-    log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('chainbreak.log'),
-            logging.StreamHandler()
-        ]
-    )
+    return parser
+
+
+def main():
+    """Main application entry point"""
+    if len(sys.argv) > 1:
+        args = build_parser().parse_args()
+    else:
+        # Documented default (standalone analysis): skip building the parser
+        args = argparse.Namespace(api=False, analyze=None, config='config.yaml',
+                                  verbose=False, port=5001)
+
+    # Add src to path
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+    # Setup logging (one rotating file handler + console, configured once)
+    logging.config.dictConfig(LOG_CFG)
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    setup_background_logging()
 
     # Check if config file exists
     if not Path(args.config).exists():
@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the ChainBreak API server
+
+Usage:
+    gunicorn -c gunicorn.conf.py "src.api:create_app()"
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("CHAINBREAK_BIND", "0.0.0.0:5001")
+workers = int(os.environ.get("CHAINBREAK_WORKERS", multiprocessing.cpu_count()))
+
+# Requests mostly wait on Neo4j and the blockchain APIs, so each worker
+# serves several at once on threads
+worker_class = "gthread"
+threads = int(os.environ.get("CHAINBREAK_THREADS", 4))
+
+# Graph fetches and batch analyses can legitimately take a while
+timeout = 120
+
+# Keep the worker heartbeat file off disk where tmpfs is available
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+
+def post_worker_init(worker):
+    """Build the ChainBreak instance before the worker accepts requests"""
+    from src.api import get_chainbreak
+    get_chainbreak()
@@ -4,146 +4,222 @@ Health Check Script for ChainBreak
 Monitors system components and provides status information
 """
 
-import requests
+import asyncio
+import atexit
+import aiohttp
 import json
+import os
 import sys
 from datetime import datetime
 import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
 
-def check_api_status(base_url="http://localhost:5001"):
+# Type annotations here are kept complete so the module can be compiled
+# with mypyc (see setup.py); it runs unchanged as plain Python.
+StatusDict = Dict[str, Any]
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    # orjson parses the raw body bytes directly, skipping the utf-8 decode
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# TCP connect timeout for the pre-flight port probe; generous enough for
+# Docker networking and remote hosts, override via the environment
+CONNECT_TIMEOUT: float = float(os.environ.get("CHAINBREAK_HEALTH_CONNECT_TIMEOUT", "1.0"))
+
+async def _port_open(base_url: str, timeout: float = CONNECT_TIMEOUT) -> bool:
+    """Cheap TCP connect probe so a down server is reported without an HTTP round-trip"""
+    parts = urlsplit(base_url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+async def check_api_status(session: aiohttp.ClientSession, base_url: str = "http://localhost:5001",
+                           connect_timeout: float = CONNECT_TIMEOUT) -> StatusDict:
     """Check if the API is responding"""
+    ts = datetime.now().isoformat()
+    if not await _port_open(base_url, connect_timeout):
+        return {
+            "status": "offline",
+            "neo4j_available": False,
+            "message": "Cannot connect to API server",
+            "timestamp": ts
+        }
     try:
-        response = requests.get(f"{base_url}/api/status", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
+        async with session.get(f"{base_url}/api/status") as response:
+            if response.status != 200:
+                return {
+                    "status": "error",
+                    "neo4j_available": False,
+                    "message": f"API returned status code {response.status}",
+                    "timestamp": ts
+                }
+            data = _json_loads(await response.read())
             return {
                 "status": "online",
                 "neo4j_available": not data.get("data", {}).get("mock_mode", False),
                 "message": data.get("message", "API is responding"),
                 "timestamp": data.get("timestamp")
             }
-        else:
-            return {
-                "status": "error",
-                "neo4j_available": False,
-                "message": f"API returned status code {response.status_code}",
-                "timestamp": datetime.now().isoformat()
-            }
-    except requests.exceptions.ConnectionError:
+    except aiohttp.ClientConnectionError:
         return {
             "status": "offline",
             "neo4j_available": False,
             "message": "Cannot connect to API server",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
     except Exception as e:
         return {
             "status": "error",
             "neo4j_available": False,
             "message": f"Error checking API: {str(e)}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
 
-def check_neo4j_direct(uri="bolt://localhost:7687", username="neo4j", password="password"):
+# Drivers are kept for the life of the process so repeated polls reuse the
+# pooled Bolt connection instead of re-doing the handshake every time
+_neo4j_drivers: Dict[Tuple[str, str, str], Any] = {}
+
+def _close_neo4j_drivers() -> None:
+    for driver in _neo4j_drivers.values():
+        driver.close()
+    _neo4j_drivers.clear()
+
+atexit.register(_close_neo4j_drivers)
+
+def _get_neo4j_driver(uri: str, username: str, password: str) -> Any:
+    key = (uri, username, password)
+    driver = _neo4j_drivers.get(key)
+    if driver is None:
+        from neo4j import GraphDatabase
+        driver = GraphDatabase.driver(
+            uri,
+            auth=(username, password),
+            max_connection_pool_size=2,
+            connection_acquisition_timeout=2
+        )
+        _neo4j_drivers[key] = driver
+    return driver
+
+def check_neo4j_direct(uri: str = "bolt://localhost:7687", username: str = "neo4j", password: str = "password") -> StatusDict:
     """Check Neo4j connection directly"""
+    ts = datetime.now().isoformat()
     try:
-        from neo4j import GraphDatabase
-        driver = GraphDatabase.driver(uri, auth=(username, password))
+        driver = _get_neo4j_driver(uri, username, password)
         with driver.session() as session:
             result = session.run("RETURN 1 as test")
             record = result.single()
-            driver.close()
             if record and record["test"] == 1:
                 return {
                     "status": "online",
                     "message": "Neo4j is responding",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": ts
                 }
             else:
                 return {
                     "status": "error",
                     "message": "Neo4j query failed",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": ts
                 }
     except ImportError:
         return {
             "status": "error",
             "message": "Neo4j Python driver not installed",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
     except Exception as e:
         return {
             "status": "offline",
             "message": f"Neo4j connection failed: {str(e)}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
 
-def check_frontend(base_url="http://localhost:5001"):
+async def check_frontend(session: aiohttp.ClientSession, base_url: str = "http://localhost:5001") -> StatusDict:
     """Check if frontend is accessible"""
+    ts = datetime.now().isoformat()
     try:
-        response = requests.get(f"{base_url}/frontend/index.html", timeout=10)
-        if response.status_code == 200:
-            return {
-                "status": "online",
-                "message": "Frontend is accessible",
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            return {
-                "status": "error",
-                "message": f"Frontend returned status code {response.status_code}",
-                "timestamp": datetime.now().isoformat()
-            }
+        async with session.get(f"{base_url}/frontend/index.html") as response:
+            if response.status == 200:
+                return {
+                    "status": "online",
+                    "message": "Frontend is accessible",
+                    "timestamp": ts
+                }
+            else:
+                return {
+                    "status": "error",
+                    "message": f"Frontend returned status code {response.status}",
+                    "timestamp": ts
+                }
     except Exception as e:
         return {
             "status": "offline",
             "message": f"Frontend check failed: {str(e)}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
 
-def print_status(component, status_data):
+_RESET = "\033[0m"
+_STATUS_STYLES: Dict[str, Tuple[str, str]] = {
+    "online": ("\033[92m", "✓"),   # Green
+    "offline": ("\033[91m", "✗"),  # Red
+}
+_WARNING_STYLE = ("\033[93m", "⚠")  # Yellow
+
+def print_status(component: str, status_data: StatusDict) -> None:
     """Print formatted status information"""
     status = status_data["status"]
-    message = status_data["message"]
-    timestamp = status_data["timestamp"]
-    
-    if status == "online":
-        color = "\033[92m"  # Green
-        icon = "✓"
-    elif status == "offline":
-        color = "\033[91m"  # Red
-        icon = "✗"
-    else:
-        color = "\033[93m"  # Yellow
-        icon = "⚠"
+    color, icon = _STATUS_STYLES.get(status, _WARNING_STYLE)
     
-    reset = "\033[0m"
-    print(f"{color}{icon} {component}: {status}{reset}")
-    print(f"   Message: {message}")
-    print(f"   Time: {timestamp}")
+    buf = (
+        f"{color}{icon} {component}: {status}{_RESET}\n"
+        f"   Message: {status_data['message']}\n"
+        f"   Time: {status_data['timestamp']}\n"
+    )
     
     if "neo4j_available" in status_data:
         neo4j_status = "available" if status_data["neo4j_available"] else "unavailable"
         neo4j_color = "\033[92m" if status_data["neo4j_available"] else "\033[91m"
-        print(f"   {neo4j_color}Neo4j: {neo4j_status}{reset}")
-    print()
+        buf += f"   {neo4j_color}Neo4j: {neo4j_status}{_RESET}\n"
+    
+    # One write per component instead of one per line
+    sys.stdout.write(buf + "\n")
+
+async def run_checks() -> List[StatusDict]:
+    """Run all component checks concurrently"""
+    timeout = aiohttp.ClientTimeout(total=10)
+    # Both HTTP probes hit the same host, so share one small keep-alive pool
+    connector = aiohttp.TCPConnector(limit=4, limit_per_host=4, keepalive_timeout=30)
+    loop = asyncio.get_running_loop()
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # gather() returns a list at runtime although typeshed declares a
+        # tuple; widen the type so mypyc does not insert a tuple check
+        probes: Awaitable[Any] = asyncio.gather(
+            check_api_status(session),
+            # run_in_executor rather than asyncio.to_thread, which needs 3.9+
+            loop.run_in_executor(None, check_neo4j_direct),
+            check_frontend(session)
+        )
+        return list(await probes)
 
-def main():
+def main() -> None:
     """Main health check function"""
     print("🔍 ChainBreak Health Check")
     print("=" * 50)
     print()
     
-    # Check API status
-    api_status = check_api_status()
-    print_status("API Server", api_status)
+    api_status, neo4j_status, frontend_status = asyncio.run(run_checks())
     
-    # Check Neo4j directly
-    neo4j_status = check_neo4j_direct()
+    print_status("API Server", api_status)
     print_status("Neo4j Database", neo4j_status)
-    
-    # Check frontend
-    frontend_status = check_frontend()
     print_status("Frontend", frontend_status)
     
     # Summary
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Pre-compress the React build for ChainBreak
+Writes .gz (and .br when the brotli package is installed) next to each text
+asset so the API server can send them without compressing per request.
+
+Usage:
+    python scripts/precompress_frontend.py [frontend/build]
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+COMPRESSIBLE_SUFFIXES = {'.js', '.css', '.html', '.json', '.svg', '.map', '.txt', '.ico'}
+MIN_SIZE = 1024  # smaller files gain nothing once headers are counted
+
+
+def precompress(build_dir: Path) -> int:
+    """Compress every eligible file under build_dir; returns the file count"""
+    count = 0
+    for path in build_dir.rglob('*'):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        if len(data) < MIN_SIZE:
+            continue
+
+        path.with_name(path.name + '.gz').write_bytes(
+            gzip.compress(data, compresslevel=9, mtime=0))
+        if BROTLI_AVAILABLE:
+            path.with_name(path.name + '.br').write_bytes(
+                brotli.compress(data, quality=11))
+        count += 1
+    return count
+
+
+def main():
+    build_dir = Path(sys.argv[1] if len(sys.argv) > 1 else 'frontend/build')
+    if not build_dir.is_dir():
+        print(f"❌ Build directory not found: {build_dir}")
+        sys.exit(1)
+
+    count = precompress(build_dir)
+    encodings = 'gzip + brotli' if BROTLI_AVAILABLE else 'gzip'
+    print(f"✅ Pre-compressed {count} files in {build_dir} ({encodings})")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@ Blockchain Forensic Analysis Tool
 
 from setuptools import setup, find_packages
 from pathlib import Path
+import os
 
 # Read the README file
 this_directory = Path(__file__).parent
@@ -17,6 +18,15 @@ with open("requirements.txt") as f:
     requirements = [line.strip() for line in f if line.strip()
                     and not line.startswith("#")]
 
+# Optionally compile the frequently polled health check and the graph
+# construction loop with mypyc:
+#   CHAINBREAK_MYPYC=1 python setup.py build_ext --inplace
+# The resulting extensions are picked up by the normal imports automatically.
+ext_modules = []
+if os.environ.get("CHAINBREAK_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["health_check.py", "src/graph_build.py"])
+
 setup(
     name="chainbreak",
     version="1.0.0",
@@ -46,6 +56,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
     extras_require={
         "dev": [
             "pytest>=6.0",
@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
 """
 Neo4j Setup and Connection Test Script
+
+Also works against Memgraph, which speaks the same Bolt protocol and Cypher
+dialect; pass --backend memgraph (or set neo4j.backend in config.yaml) for
+faster local/CI databases.
 """
 
+import argparse
+import functools
 import sys
 import os
 import logging
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -16,25 +28,50 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def load_config():
-    """Load configuration from config.yaml"""
+SUPPORTED_BACKENDS = ("neo4j", "memgraph")
+
+# Memgraph uses its own schema DDL syntax and does not allow index or
+# constraint changes inside multi-statement transactions
+MEMGRAPH_SCHEMA = [
+    "CREATE CONSTRAINT ON (a:Address) ASSERT a.address IS UNIQUE",
+    "CREATE CONSTRAINT ON (t:Transaction) ASSERT t.tx_hash IS UNIQUE",
+    "CREATE CONSTRAINT ON (b:Block) ASSERT b.block_hash IS UNIQUE",
+    "CREATE INDEX ON :Address(balance)",
+    "CREATE INDEX ON :Transaction(value)",
+    "CREATE INDEX ON :Address(risk_score)"
+]
+
+@functools.lru_cache(maxsize=1)
+def load_config(path="config.yaml"):
+    """Load configuration from config.yaml (parsed once per process)"""
     try:
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=_Loader)
+        neo4j_config = config.setdefault('neo4j', {})
+        backend = neo4j_config.setdefault('backend', 'neo4j')
+        if backend not in SUPPORTED_BACKENDS:
+            logger.error(f"Unsupported neo4j.backend '{backend}', expected one of {SUPPORTED_BACKENDS}")
+            return None
         return config
     except Exception as e:
         logger.error(f"Failed to load config: {e}")
         return None
 
-def test_neo4j_connection(uri, username, password):
+def _probe(tx):
+    """Managed read transaction: trivial round-trip query"""
+    return tx.run("RETURN 1 AS test").single()["test"]
+
+def _run_statements(tx, statements, **params):
+    """Managed write transaction: run each statement and drain its result"""
+    for statement in statements:
+        tx.run(statement, **params).consume()
+
+def test_neo4j_connection(driver):
     """Test Neo4j connection"""
     try:
-        driver = GraphDatabase.driver(uri, auth=(username, password))
-        
+        # execute_read retries transient failures (e.g. leader switch) itself
         with driver.session() as session:
-            result = session.run("RETURN 1 as test")
-            record = result.single()
-            if record and record["test"] == 1:
+            if session.execute_read(_probe) == 1:
                 logger.info("✅ Neo4j connection successful!")
                 return True
             else:
@@ -44,43 +81,82 @@ def test_neo4j_connection(uri, username, password):
     except Exception as e:
         logger.error(f"❌ Neo4j connection failed: {e}")
         return False
-    finally:
-        if 'driver' in locals():
-            driver.close()
 
-def setup_neo4j_database(uri, username, password):
+# Indexes (first map) and unique constraints (second map) declared in one
+# APOC call; dropExisting=false keeps any schema created outside this script
+APOC_SCHEMA_ASSERT = """
+    CALL apoc.schema.assert(
+        {Address: ['balance', 'risk_score'], Transaction: ['value']},
+        {Address: ['address'], Transaction: ['tx_hash'], Block: ['block_hash']},
+        false
+    )
+"""
+
+# Raised when APOC is not installed; any other ClientError is a real failure
+PROCEDURE_NOT_FOUND = "Neo.ClientError.Procedure.ProcedureNotFound"
+
+def _assert_schema(tx):
+    """Managed write transaction: apply APOC_SCHEMA_ASSERT and return its report rows"""
+    return tx.run(APOC_SCHEMA_ASSERT).data()
+
+def setup_memgraph_database(driver):
+    """Setup Memgraph database with constraints and indexes"""
+    try:
+        with driver.session() as session:
+            for statement in MEMGRAPH_SCHEMA:
+                session.run(statement).consume()
+                logger.info(f"✅ Applied: {statement}")
+        
+        logger.info("✅ Memgraph database setup completed!")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Memgraph database setup failed: {e}")
+        return False
+
+def setup_neo4j_database(driver, backend="neo4j"):
     """Setup Neo4j database with constraints and indexes"""
+    if backend == "memgraph":
+        return setup_memgraph_database(driver)
+    
     try:
-        driver = GraphDatabase.driver(uri, auth=(username, password))
+        # Create constraints
+        constraints = [
+            "CREATE CONSTRAINT address_unique IF NOT EXISTS FOR (a:Address) REQUIRE a.address IS UNIQUE",
+            "CREATE CONSTRAINT transaction_unique IF NOT EXISTS FOR (t:Transaction) REQUIRE t.tx_hash IS UNIQUE",
+            "CREATE CONSTRAINT block_unique IF NOT EXISTS FOR (b:Block) REQUIRE b.block_hash IS UNIQUE"
+        ]
+        
+        # Create indexes
+        indexes = [
+            "CREATE INDEX address_balance IF NOT EXISTS FOR (a:Address) ON (a.balance)",
+            "CREATE INDEX transaction_value IF NOT EXISTS FOR (t:Transaction) ON (t.value)",
+            "CREATE INDEX address_risk_score IF NOT EXISTS FOR (a:Address) ON (a.risk_score)"
+        ]
         
         with driver.session() as session:
-            # Create constraints
-            constraints = [
-                "CREATE CONSTRAINT address_unique IF NOT EXISTS FOR (a:Address) REQUIRE a.address IS UNIQUE",
-                "CREATE CONSTRAINT transaction_unique IF NOT EXISTS FOR (t:Transaction) REQUIRE t.tx_hash IS UNIQUE",
-                "CREATE CONSTRAINT block_unique IF NOT EXISTS FOR (b:Block) REQUIRE b.block_hash IS UNIQUE"
-            ]
-            
-            for constraint in constraints:
-                try:
-                    session.run(constraint)
-                    logger.info(f"✅ Created constraint: {constraint.split()[2]}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Constraint creation failed: {e}")
-            
-            # Create indexes
-            indexes = [
-                "CREATE INDEX address_balance IF NOT EXISTS FOR (a:Address) ON (a.balance)",
-                "CREATE INDEX transaction_value IF NOT EXISTS FOR (t:Transaction) ON (t.value)",
-                "CREATE INDEX address_risk_score IF NOT EXISTS FOR (a:Address) ON (a.risk_score)"
-            ]
-            
-            for index in indexes:
-                try:
-                    session.run(index)
-                    logger.info(f"✅ Created index: {index.split()[2]}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Index creation failed: {e}")
+            try:
+                # Single round-trip, one schema lock acquisition
+                applied = session.execute_write(_assert_schema)
+            except ClientError as e:
+                if e.code != PROCEDURE_NOT_FOUND:
+                    raise
+                # APOC not installed: apply each statement on its own so one
+                # failure (e.g. existing duplicates) does not roll back the rest
+                logger.info("apoc.schema.assert not installed, applying plain DDL")
+                for kind, statements in (("constraint", constraints), ("index", indexes)):
+                    for statement in statements:
+                        name = statement.split()[2]
+                        try:
+                            session.run(statement).consume()
+                            logger.info(f"✅ Created {kind}: {name}")
+                        except ClientError as e:
+                            logger.warning(f"⚠️ {kind.capitalize()} creation failed ({name}): {e}")
+            else:
+                for row in applied:
+                    kind = "constraint" if row.get("unique") else "index"
+                    keys = ", ".join(row.get("keys") or [row.get("key")])
+                    logger.info(f"✅ apoc.schema.assert {row.get('action')} {kind}: :{row.get('label')}({keys})")
         
         logger.info("✅ Neo4j database setup completed!")
         return True
@@ -88,56 +164,65 @@ def setup_neo4j_database(uri, username, password):
     except Exception as e:
         logger.error(f"❌ Neo4j database setup failed: {e}")
         return False
-    finally:
-        if 'driver' in locals():
-            driver.close()
 
-def create_sample_data(uri, username, password):
+def create_sample_data(driver):
     """Create sample data for testing"""
     try:
-        driver = GraphDatabase.driver(uri, auth=(username, password))
+        # Create sample addresses
+        sample_addresses = [
+            {
+                "address": "13AM4VW2dhxYgXeQepoHkHSQuy6NgaEb94",
+                "balance": 0,
+                "risk_score": 0.95,
+                "is_illicit": True,
+                "illicit_type": "ransomware"
+            },
+            {
+                "address": "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+                "balance": 5001000000,
+                "risk_score": 0.1,
+                "is_illicit": False,
+                "illicit_type": None
+            }
+        ]
         
         with driver.session() as session:
-            # Create sample addresses
-            sample_addresses = [
-                {
-                    "address": "13AM4VW2dhxYgXeQepoHkHSQuy6NgaEb94",
-                    "balance": 0,
-                    "risk_score": 0.95,
-                    "is_illicit": True,
-                    "illicit_type": "ransomware"
-                },
-                {
-                    "address": "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
-                    "balance": 5001000000,
-                    "risk_score": 0.1,
-                    "is_illicit": False,
-                    "illicit_type": None
-                }
-            ]
-            
-            for addr_data in sample_addresses:
-                session.run("""
-                    MERGE (a:Address {address: $address})
-                    SET a.balance = $balance,
-                        a.risk_score = $risk_score,
-                        a.is_illicit = $is_illicit,
-                        a.illicit_type = $illicit_type,
-                        a.created_at = datetime()
-                """, **addr_data)
-            
-            logger.info("✅ Sample data created successfully!")
-            return True
+            # Single round-trip for all rows
+            session.execute_write(_run_statements, ["""
+                UNWIND $rows AS r
+                MERGE (a:Address {address: r.address})
+                SET a.balance = r.balance,
+                    a.risk_score = r.risk_score,
+                    a.is_illicit = r.is_illicit,
+                    a.illicit_type = r.illicit_type,
+                    a.created_at = datetime()
+            """], rows=sample_addresses)
+        
+        logger.info("✅ Sample data created successfully!")
+        return True
             
     except Exception as e:
         logger.error(f"❌ Sample data creation failed: {e}")
         return False
-    finally:
-        if 'driver' in locals():
-            driver.close()
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Set up the ChainBreak graph database and load sample data"
+    )
+    parser.add_argument(
+        '--backend',
+        choices=SUPPORTED_BACKENDS,
+        help="Graph database behind the Bolt URI. 'memgraph' uses Memgraph "
+             "schema syntax and is a faster drop-in for dev/CI "
+             "(default: neo4j.backend from config.yaml, else neo4j)"
+    )
+    return parser.parse_args()
 
 def main():
     """Main function"""
+    args = parse_args()
+    
     print("=" * 80)
     print("NEO4J SETUP AND CONNECTION TEST")
     print("=" * 80)
@@ -152,43 +237,57 @@ def main():
     uri = neo4j_config.get('uri', 'bolt://localhost:7687')
     username = neo4j_config.get('username', 'neo4j')
     password = neo4j_config.get('password', 'password')
+    backend = args.backend or neo4j_config['backend']
     
     print(f"\nNeo4j Configuration:")
+    print(f"  Backend: {backend}")
     print(f"  URI: {uri}")
     print(f"  Username: {username}")
     print(f"  Password: {'*' * len(password)}")
     
-    # Test connection
-    print(f"\n1. Testing Neo4j connection...")
-    if test_neo4j_connection(uri, username, password):
-        print("✅ Connection successful!")
+    # One driver (and connection pool) shared by every step
+    driver = GraphDatabase.driver(
+        uri,
+        auth=(username, password),
+        max_connection_pool_size=10,
+        connection_acquisition_timeout=10,
+        keep_alive=True
+    )
+    
+    try:
+        # Test connection
+        print(f"\n1. Testing Neo4j connection...")
+        if test_neo4j_connection(driver):
+            print("✅ Connection successful!")
         
-        # Setup database
-        print(f"\n2. Setting up Neo4j database...")
-        if setup_neo4j_database(uri, username, password):
-            print("✅ Database setup completed!")
+            # Setup database
+            print(f"\n2. Setting up Neo4j database...")
+            if setup_neo4j_database(driver, backend):
+                print("✅ Database setup completed!")
             
-            # Create sample data
-            print(f"\n3. Creating sample data...")
-            if create_sample_data(uri, username, password):
-                print("✅ Sample data created!")
+                # Create sample data
+                print(f"\n3. Creating sample data...")
+                if create_sample_data(driver):
+                    print("✅ Sample data created!")
                 
-                print(f"\n🎉 Neo4j is ready for use!")
-                print(f"\nNext steps:")
-                print(f"  1. Run the ChainBreak application")
-                print(f"  2. Test threat intelligence integration")
-                print(f"  3. Verify graph visualization")
+                    print(f"\n🎉 Neo4j is ready for use!")
+                    print(f"\nNext steps:")
+                    print(f"  1. Run the ChainBreak application")
+                    print(f"  2. Test threat intelligence integration")
+                    print(f"  3. Verify graph visualization")
+                else:
+                    print("❌ Sample data creation failed")
             else:
-                print("❌ Sample data creation failed")
+                print("❌ Database setup failed")
         else:
-            print("❌ Database setup failed")
-    else:
-        print("❌ Connection failed!")
-        print(f"\nTroubleshooting:")
-        print(f"  1. Make sure Neo4j is running on {uri}")
-        print(f"  2. Check username/password: {username}/{'*' * len(password)}")
-        print(f"  3. Install Neo4j Desktop or use Docker")
-        print(f"  4. Update config.yaml with correct connection details")
+            print("❌ Connection failed!")
+            print(f"\nTroubleshooting:")
+            print(f"  1. Make sure Neo4j is running on {uri}")
+            print(f"  2. Check username/password: {username}/{'*' * len(password)}")
+            print(f"  3. Install Neo4j Desktop or use Docker")
+            print(f"  4. Update config.yaml with correct connection details")
+    finally:
+        driver.close()
 
 if __name__ == "__main__":
     main()
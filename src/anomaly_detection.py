@@ -5,6 +5,7 @@ Implements algorithms for detecting suspicious transaction patterns
 
 from neo4j import GraphDatabase
 import numpy as np
+from sklearn.base import clone
 from sklearn.ensemble import IsolationForest
 import logging
 from typing import List, Dict, Any, Optional
@@ -205,10 +206,12 @@ class VolumeAnomalyDetector:
             values = np.array([record['value']
                               for record in data]).reshape(-1, 1)
 
-            # Fit and predict
-            self.isolation_forest.fit(values)
-            anomaly_scores = self.isolation_forest.decision_function(values)
-            predictions = self.isolation_forest.predict(values)
+            # Fit and predict on a per-call copy: concurrent analyses share
+            # this detector, and a shared model could be refit between calls
+            isolation_forest = clone(self.isolation_forest)
+            isolation_forest.fit(values)
+            anomaly_scores = isolation_forest.decision_function(values)
+            predictions = isolation_forest.predict(values)
 
             # Return anomalous transactions
             anomalous_indices = np.where(predictions == -1)[0]
@@ -1,15 +1,41 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, abort, jsonify, request, send_file, send_from_directory
 from flask_cors import CORS
+from werkzeug.security import safe_join
+import functools
 import logging
 import traceback
+import io
 import json
+import mimetypes
+import os
+import re
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from .chainbreak import ChainBreak
 from .api_frontend import bp as frontend_bp
+from .fetch_blockchain_com import BlockchainComFetcher, BlockchainAPIError, RateLimitError
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Request bodies at least this large are parsed incrementally where supported
+STREAMING_JSON_MIN_BYTES = 64 * 1024
 
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+# static_folder=None: /static/ is served from the React build by serve_static
+app = Flask(__name__, static_folder=None)
 
 # Enable CORS before registering blueprints
 CORS(app, resources={
@@ -19,81 +45,190 @@ CORS(app, resources={
 
 app.register_blueprint(frontend_bp)
 
+# Reject oversized uploads before they are read or parsed (413)
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+# Louvain is super-linear in graph size; cap nodes + edges per request
+app.config['LOUVAIN_MAX_GRAPH_SIZE'] = 200000
+
+# When deployed behind a proxy that understands X-Sendfile (Apache
+# mod_xsendfile, lighttpd), let it stream static files with sendfile(2)
+# instead of copying them through the worker. With nginx, serve the React
+# build directly instead, e.g.:
+#   location /static/ { root frontend/build; sendfile on; tcp_nopush on; }
+app.use_x_sendfile = os.environ.get(
+    "CHAINBREAK_X_SENDFILE", "").lower() in ("1", "true", "yes")
+
 # Unified data directory - use data/graph (consistent with actual structure)
 GRAPH_DIR = Path("data/graph")
 GRAPH_DIR.mkdir(parents=True, exist_ok=True)
-
-logger.info(f"Graph directory initialized: {GRAPH_DIR.resolve()}")
+GRAPH_DIR_ABS = os.path.abspath(GRAPH_DIR)
+# Upper bound on how stale /api/graph/list can be when a change does not
+# show up in GRAPH_DIR's stat (coarse mtime resolution)
+GRAPH_LIST_TTL_S = 5
+
+# Bitcoin address formats accepted by /api/graph/address; the first character
+# decides which pattern applies, so only one is ever tried
+_RE_P2PKH_P2SH = re.compile(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$')
+_RE_BECH32 = re.compile(r'^bc1[a-z0-9]{39,59}$')
+_SAFE_FILENAME = re.compile(r'[^A-Za-z0-9_\-]')
+
+# Frontend locations do not change while the server runs; resolve them once
+# instead of on every static request
+FRONTEND_DIR = str(Path("frontend").resolve())
+FRONTEND_BUILD = Path("frontend/build").resolve()
+FRONTEND_BUILD_DIR = str(FRONTEND_BUILD)
+FRONTEND_BUILD_STATIC_DIR = str(Path("frontend/build/static").resolve())
+FRONTEND_STATIC_DIR = str(Path("frontend/static").resolve())
+HAS_FRONTEND_BUILD = FRONTEND_BUILD.exists()
+HAS_FRONTEND_BUILD_STATIC = Path(FRONTEND_BUILD_STATIC_DIR).exists()
+
+# CRA emits content-hashed names under build/static, so those assets can be
+# cached by browsers for a year; a new build changes the URLs
+STATIC_MAX_AGE = 31536000
+
+# Pre-built variants written next to the originals by
+# scripts/precompress_frontend.py, in order of preference
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+logger.info("Graph directory initialized: %s", GRAPH_DIR.resolve())
 
 
 # Global ChainBreak instance for better performance
 _chainbreak_instance = None
 _chainbreak_initialized = False
+# Serialises construction so concurrent first requests build a single instance
+_chainbreak_lock = threading.Lock()
 
 def get_chainbreak():
     """Get or create ChainBreak instance with singleton pattern"""
     global _chainbreak_instance, _chainbreak_initialized
 
-    if _chainbreak_instance is not None and _chainbreak_initialized:
+    # Fast path without taking the lock once initialized
+    if _chainbreak_initialized:
         return _chainbreak_instance
 
-    try:
-        from .chainbreak import ChainBreak
-        _chainbreak_instance = ChainBreak()
-        _chainbreak_initialized = True
-        logger.info("ChainBreak instance created successfully")
-        return _chainbreak_instance
-    except Exception as e:
-        logger.error(f"Failed to initialize ChainBreak: {e}")
-        _chainbreak_initialized = False
-        return None
+    with _chainbreak_lock:
+        if _chainbreak_initialized:
+            return _chainbreak_instance
 
-def reset_chainbreak():
-    """Reset ChainBreak instance (useful for testing or reconfiguration)"""
-    global _chainbreak_instance, _chainbreak_initialized
-    if _chainbreak_instance is not None:
         try:
-            _chainbreak_instance.close()
+            _chainbreak_instance = ChainBreak()
+            _chainbreak_initialized = True
+            logger.info("ChainBreak instance created successfully")
+            return _chainbreak_instance
         except Exception as e:
-            logger.warning(f"Error closing ChainBreak instance: {e}")
+            logger.error("Failed to initialize ChainBreak: %s", e)
+            _chainbreak_initialized = False
+            return None
 
-    _chainbreak_instance = None
-    _chainbreak_initialized = False
+def reset_chainbreak():
+    """Reset ChainBreak instance (useful for testing or reconfiguration)"""
+    global _chainbreak_instance, _chainbreak_initialized
+    with _chainbreak_lock:
+        if _chainbreak_instance is not None:
+            try:
+                _chainbreak_instance.close()
+            except Exception as e:
+                logger.warning("Error closing ChainBreak instance: %s", e)
+
+        _chainbreak_instance = None
+        _chainbreak_initialized = False
     logger.info("ChainBreak instance reset")
 
 
+# Shared blockchain.com fetcher so its pooled HTTP session (keep-alive
+# connections), response cache and rate limiter persist across requests
+_fetcher_instance = None
+_fetcher_lock = threading.Lock()
+
+def get_fetcher():
+    """Get or create the process-wide BlockchainComFetcher"""
+    global _fetcher_instance
+
+    if _fetcher_instance is not None:
+        return _fetcher_instance
+
+    with _fetcher_lock:
+        if _fetcher_instance is None:
+            _fetcher_instance = BlockchainComFetcher()
+            logger.info("BlockchainComFetcher instance created")
+        return _fetcher_instance
+
+
+def _send_precompressed(directory, filename, **kwargs):
+    """Send a pre-built .br/.gz sibling of filename when the client accepts it"""
+    for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+        if encoding not in request.accept_encodings:
+            continue
+        candidate = safe_join(directory, filename + suffix)
+        if candidate and os.path.isfile(candidate):
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            response = send_from_directory(
+                directory, filename + suffix, mimetype=mimetype, **kwargs)
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = send_from_directory(directory, filename, **kwargs)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _json_response(payload, status=200):
+    """Serialize a large payload with orjson when available, else jsonify
+
+    orjson encodes int-keyed dicts and NumPy values directly, so results
+    need no intermediate copy with stringified keys.
+    """
+    if not ORJSON_AVAILABLE:
+        return jsonify(payload), status
+    body = orjson.dumps(
+        payload, default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+def _conditional_json(payload, max_age=5):
+    """JSON response with a content ETag, answering If-None-Match with 304
+
+    For endpoints the dashboard polls: browsers reuse the body for max_age
+    seconds and then revalidate cheaply.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    response.cache_control.max_age = max_age
+    response.cache_control.must_revalidate = True
+    return response.make_conditional(request)
+
+
 @app.route("/")
 def index_new():
     try:
         # Try to serve the React build index.html
-        frontend_build = Path("frontend/build").resolve()
-        if frontend_build.exists():
-            logger.info(f"Serving React frontend from {frontend_build}")
-            return send_from_directory(str(frontend_build), "index.html")
+        if HAS_FRONTEND_BUILD:
+            logger.debug("Serving React frontend from %s", FRONTEND_BUILD_DIR)
+            return send_from_directory(FRONTEND_BUILD_DIR, "index.html")
         else:
-            logger.info(
-                "React build not found, falling back to static frontend")
-            static_frontend = Path("frontend").resolve()
-            return send_from_directory(str(static_frontend), "index.html")
+            logger.debug("React build not found, falling back to static frontend")
+            return send_from_directory(FRONTEND_DIR, "index.html")
     except Exception as e:
-        logger.error(f"Error serving frontend: {e}")
+        logger.error("Error serving frontend: %s", e)
         return jsonify({"error": "Frontend not available"}), 404
 
 
 @app.route("/static/<path:filename>")
 def serve_static(filename):
     try:
-        frontend_build = Path("frontend/build/static").resolve()
-        if frontend_build.exists():
-            logger.info(f"Serving static file from React build: {filename}")
-            return send_from_directory(str(frontend_build), filename)
+        if HAS_FRONTEND_BUILD_STATIC:
+            logger.debug("Serving static file from React build: %s", filename)
+            response = _send_precompressed(
+                FRONTEND_BUILD_STATIC_DIR, filename, max_age=STATIC_MAX_AGE)
+            response.cache_control.immutable = True
+            return response
         else:
-            logger.info(
-                f"React static not found, falling back to static: {filename}")
-            static_dir = Path("frontend/static").resolve()
-            return send_from_directory(str(static_dir), filename)
+            logger.debug("React static not found, falling back to static: %s", filename)
+            return send_from_directory(FRONTEND_STATIC_DIR, filename)
     except Exception as e:
-        logger.error(f"Error serving static file {filename}: {e}")
+        logger.error("Error serving static file %s: %s", filename, e)
         return jsonify({"error": "Static file not found"}), 404
 
 
@@ -104,20 +239,17 @@ def serve_frontend_files(filename):
         if filename.startswith('api/'):
             return jsonify({"error": "API endpoint not found"}), 404
 
-        frontend_build = Path("frontend/build").resolve()
-        if frontend_build.exists():
-            file_path = frontend_build / filename
-            if file_path.exists() and file_path.is_file():
-                logger.info(f"Serving React file: {filename}")
-                return send_from_directory(str(frontend_build), filename)
+        # One stat per request; send_from_directory rejects paths that
+        # escape the build directory
+        if HAS_FRONTEND_BUILD and (FRONTEND_BUILD / filename).is_file():
+            logger.debug("Serving React file: %s", filename)
+            return _send_precompressed(FRONTEND_BUILD_DIR, filename)
 
         # Fallback to old static files
-        logger.info(
-            f"React file not found, falling back to static: {filename}")
-        static_dir = Path("frontend").resolve()
-        return send_from_directory(str(static_dir), filename)
+        logger.debug("React file not found, falling back to static: %s", filename)
+        return send_from_directory(FRONTEND_DIR, filename)
     except Exception as e:
-        logger.error(f"Error serving frontend file {filename}: {e}")
+        logger.error("Error serving frontend file %s: %s", filename, e)
         return jsonify({"error": "File not found"}), 404
 
 
@@ -140,7 +272,7 @@ def get_backend_mode():
                 "error": "ChainBreak not initialized"
             }), 500
     except Exception as e:
-        logger.error(f"Error getting backend mode: {e}")
+        logger.error("Error getting backend mode: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
@@ -154,7 +286,7 @@ def get_system_status():
         chainbreak = get_chainbreak()
         if chainbreak:
             status = chainbreak.get_system_status()
-            return jsonify({
+            return _json_response({
                 "success": True,
                 "data": status
             })
@@ -164,21 +296,36 @@ def get_system_status():
                 "error": "ChainBreak not initialized"
             }), 500
     except Exception as e:
-        logger.error(f"Error getting system status: {e}")
+        logger.error("Error getting system status: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
         }), 500
 
 
+@functools.lru_cache(maxsize=1)
+def _list_graph_files(dir_key):
+    """Names of saved graph files, cached per (mtime, size, TTL bucket) of GRAPH_DIR
+
+    Adding, removing or renaming a file bumps the directory mtime and size,
+    but on filesystems with coarse mtime resolution a change can leave both
+    untouched, so the TTL bucket bounds how long a stale listing is served.
+    """
+    with os.scandir(GRAPH_DIR) as entries:
+        return tuple(sorted(entry.name for entry in entries
+                            if entry.name.endswith(".json") and not entry.name.startswith(".")))
+
+
 @app.route("/api/graph/list", methods=["GET"])
 def list_graphs():
     """List available graph files"""
     try:
-        files = [f.name for f in GRAPH_DIR.glob("*.json")]
-        return jsonify({"success": True, "files": files})
+        st = GRAPH_DIR.stat()
+        files = _list_graph_files(
+            (st.st_mtime_ns, st.st_size, int(time.monotonic() // GRAPH_LIST_TTL_S)))
+        return _json_response({"success": True, "files": list(files)})
     except Exception as e:
-        logger.error(f"Error listing graphs: {e}")
+        logger.error("Error listing graphs: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -197,34 +344,28 @@ def fetch_graph_address():
         if not address:
             return jsonify({"success": False, "error": "Address is required"}), 400
 
-        if not isinstance(tx_limit, int) or tx_limit < 1 or tx_limit > 200:
-            return jsonify({"success": False, "error": "Transaction limit must be between 1 and 200"}), 400
+        # Same bound as the fetcher's rawaddr limit
+        if not isinstance(tx_limit, int) or tx_limit < 1 or tx_limit > 1000:
+            return jsonify({"success": False, "error": "Transaction limit must be between 1 and 1000"}), 400
 
         # Validate Bitcoin address format
-        import re
-        if not re.match(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$|^bc1[a-z0-9]{39,59}$', address):
+        address_re = _RE_P2PKH_P2SH if address[:1] in ('1', '3') else _RE_BECH32
+        if not address_re.match(address):
             return jsonify({"success": False, "error": "Invalid Bitcoin address format"}), 400
 
-        chainbreak = get_chainbreak()
-        if not chainbreak:
-            return jsonify({"success": False, "error": "ChainBreak not initialized"}), 500
-
-        logger.info(f"Fetching graph for address: {address[:10]}... with limit {tx_limit}")
-
-        # Import here to avoid circular imports
-        from .fetch_blockchain_com import BlockchainComFetcher, BlockchainAPIError, RateLimitError
+        logger.info("Fetching graph for address: %s... with limit %s", address[:10], tx_limit)
 
         try:
-            fetcher = BlockchainComFetcher()
+            fetcher = get_fetcher()
             graph = fetcher.build_graph_for_address(address, tx_limit=tx_limit)
         except RateLimitError as e:
-            logger.warning(f"Rate limit exceeded for address {address}: {e}")
+            logger.warning("Rate limit exceeded for address %s: %s", address, e)
             return jsonify({"success": False, "error": "API rate limit exceeded. Please try again later."}), 429
         except BlockchainAPIError as e:
-            logger.error(f"Blockchain API error for address {address}: {e}")
+            logger.error("Blockchain API error for address %s: %s", address, e)
             return jsonify({"success": False, "error": f"Blockchain API error: {str(e)}"}), 502
         except Exception as e:
-            logger.error(f"Unexpected error fetching graph for {address}: {e}")
+            logger.error("Unexpected error fetching graph for %s: %s", address, e)
             return jsonify({"success": False, "error": "Failed to fetch blockchain data"}), 500
 
         # Validate graph data
@@ -236,15 +377,20 @@ def fetch_graph_address():
             return jsonify({"success": False, "error": "No transaction data found for this address"}), 404
 
         # Sanitize filename - only allow alphanumeric, underscore, hyphen
-        safe_address = re.sub(r'[^A-Za-z0-9_\-]', '_', address)
+        safe_address = _SAFE_FILENAME.sub('_', address)
         filename = f"graph_{safe_address[:12]}_{tx_limit}.json"
 
         try:
             file_path = GRAPH_DIR / filename
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(graph, f, indent=2, ensure_ascii=False)
+            # Compact output: the file is served verbatim by get_graph
+            if ORJSON_AVAILABLE:
+                file_path.write_bytes(
+                    orjson.dumps(graph, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(graph, f, ensure_ascii=False, separators=(",", ":"))
 
-            logger.info(f"Graph saved: {filename} with {len(nodes)} nodes, {len(graph.get('edges', []))} edges")
+            logger.info("Graph saved: %s with %s nodes, %s edges", filename, len(nodes), len(graph.get('edges', [])))
 
             return jsonify({
                 "success": True,
@@ -258,11 +404,11 @@ def fetch_graph_address():
             })
 
         except Exception as e:
-            logger.error(f"Error saving graph file {filename}: {e}")
+            logger.error("Error saving graph file %s: %s", filename, e)
             return jsonify({"success": False, "error": "Failed to save graph data"}), 500
 
     except Exception as e:
-        logger.error(f"Unexpected error in fetch_graph_address: {traceback.format_exc()}")
+        logger.error("Unexpected error in fetch_graph_address: %s", traceback.format_exc())
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
@@ -274,17 +420,21 @@ def get_graph():
         if not name:
             return jsonify({"success": False, "error": "Name parameter required"}), 400
 
-        file_path = GRAPH_DIR / name
-        if not file_path.exists():
-            return jsonify({"success": False, "error": "Graph not found"}), 404
-
-        with open(file_path, "r") as f:
-            graph_json = json.load(f)
+        file_path = safe_join(GRAPH_DIR_ABS, name)
+        if file_path is None:
+            return jsonify({"success": False, "error": "Invalid graph name"}), 400
 
-        return jsonify(graph_json)
+        # The file is already the JSON the client wants; stream it as-is
+        # (with ETag/304 support) instead of parsing and re-serialising it.
+        # send_file's own open/stat doubles as the existence check.
+        try:
+            return send_file(file_path, mimetype="application/json",
+                             conditional=True, max_age=60)
+        except (FileNotFoundError, IsADirectoryError):
+            return jsonify({"success": False, "error": "Graph not found"}), 404
 
     except Exception as e:
-        logger.error(f"Error getting graph: {e}")
+        logger.error("Error getting graph: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -309,7 +459,7 @@ def analyze_address():
         return jsonify({"success": True, "data": result})
 
     except Exception as e:
-        logger.error(f"Error analyzing address: {e}")
+        logger.error("Error analyzing address: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -317,7 +467,7 @@ def analyze_address():
 def analyze_multiple_addresses():
     """Analyze multiple addresses"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False)
         addresses = data.get("addresses", [])
         blockchain = data.get("blockchain", "btc")
 
@@ -332,7 +482,7 @@ def analyze_multiple_addresses():
         return jsonify({"success": True, "data": result})
 
     except Exception as e:
-        logger.error(f"Error analyzing addresses: {e}")
+        logger.error("Error analyzing addresses: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -354,7 +504,7 @@ def export_to_gephi():
         return jsonify({"success": True, "data": {"file": result}})
 
     except Exception as e:
-        logger.error(f"Error exporting to Gephi: {e}")
+        logger.error("Error exporting to Gephi: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -377,7 +527,7 @@ def generate_risk_report():
         return jsonify({"success": True, "data": {"report": result}})
 
     except Exception as e:
-        logger.error(f"Error generating risk report: {e}")
+        logger.error("Error generating risk report: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -390,10 +540,10 @@ def get_analyzed_addresses():
             return jsonify({"success": False, "error": "ChainBreak not initialized"}), 500
 
         # This would need to be implemented in ChainBreak class
-        return jsonify({"success": True, "data": {"addresses": []}})
+        return _conditional_json({"success": True, "data": {"addresses": []}})
 
     except Exception as e:
-        logger.error(f"Error getting addresses: {e}")
+        logger.error("Error getting addresses: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -406,10 +556,10 @@ def get_statistics():
             return jsonify({"success": False, "error": "ChainBreak not initialized"}), 500
 
         # This would need to be implemented in ChainBreak class
-        return jsonify({"success": True, "data": {"statistics": {}}})
+        return _conditional_json({"success": True, "data": {"statistics": {}}})
 
     except Exception as e:
-        logger.error(f"Error getting statistics: {e}")
+        logger.error("Error getting statistics: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -425,7 +575,7 @@ def get_threat_intelligence_status():
         return jsonify({"success": True, "data": status})
 
     except Exception as e:
-        logger.error(f"Error getting threat intelligence status: {e}")
+        logger.error("Error getting threat intelligence status: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -447,16 +597,39 @@ def check_address_threat_intelligence():
         return jsonify({"success": True, "data": result})
 
     except Exception as e:
-        logger.error(f"Error checking address threat intelligence: {e}")
+        logger.error("Error checking address threat intelligence: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _stream_graph_node_ids(stream):
+    """Incrementally read graph_data.nodes[*].id from a JSON request body
+
+    Returns a minimal graph_data dict ({"nodes": [{"id": ...}, ...]}), or
+    None when the body has no non-empty graph_data object.
+    """
+    has_graph_data = False
+    nodes = []
+    # Werkzeug's input stream treats ijson's read(0) probe as a disconnect;
+    # a buffered reader answers it without touching the socket
+    for prefix, event, value in ijson.parse(io.BufferedReader(stream)):
+        if prefix == "graph_data" and event == "map_key":
+            has_graph_data = True
+        elif prefix == "graph_data.nodes.item.id":
+            nodes.append({"id": value})
+    return {"nodes": nodes} if has_graph_data else None
+
+
 @app.route("/api/threat-intelligence/check-graph", methods=["POST"])
 def check_graph_illicit_addresses():
     """Check all addresses in a graph for illicit activity"""
     try:
-        data = request.get_json()
-        graph_data = data.get("graph_data")
+        if IJSON_AVAILABLE and (request.content_length or 0) >= STREAMING_JSON_MIN_BYTES:
+            # Only node ids are checked, so pull them straight off the stream
+            # instead of materialising the whole uploaded graph
+            graph_data = _stream_graph_node_ids(request.stream)
+        else:
+            data = request.get_json(cache=False)
+            graph_data = data.get("graph_data")
 
         if not graph_data:
             return jsonify({"success": False, "error": "Graph data required"}), 400
@@ -466,10 +639,10 @@ def check_graph_illicit_addresses():
             return jsonify({"success": False, "error": "ChainBreak not initialized"}), 500
 
         result = chainbreak.check_illicit_addresses_in_graph(graph_data)
-        return jsonify({"success": True, "data": result})
+        return _json_response({"success": True, "data": result})
 
     except Exception as e:
-        logger.error(f"Error checking graph illicit addresses: {e}")
+        logger.error("Error checking graph illicit addresses: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -497,7 +670,7 @@ def run_louvain_community_detection():
     }
     """
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False)
         
         # Validate input
         if not data:
@@ -515,19 +688,23 @@ def run_louvain_community_detection():
         if len(edges) == 0:
             return jsonify({"success": False, "error": "Graph must have at least one edge"}), 400
         
+        max_graph_size = app.config['LOUVAIN_MAX_GRAPH_SIZE']
+        if len(nodes) + len(edges) > max_graph_size:
+            return jsonify({"success": False, "error": f"Graph too large: at most {max_graph_size} nodes plus edges"}), 413
+        
         resolution = data.get("resolution", 1.0)
         
         # Validate resolution parameter
         if not isinstance(resolution, (int, float)) or resolution <= 0:
             return jsonify({"success": False, "error": "Resolution must be a positive number"}), 400
         
-        logger.info(f"Running Louvain algorithm on graph with {len(nodes)} nodes and {len(edges)} edges")
+        logger.info("Running Louvain algorithm on graph with %s nodes and %s edges", len(nodes), len(edges))
         
-        # Import the Louvain function
+        # Import the Louvain function (networkit-backed for large graphs)
         try:
-            from .test_louvain_simple import run_louvain_algorithm
+            from .test_louvain_simple import run_louvain_fast
         except ImportError:
-            logger.error("Failed to import run_louvain_algorithm - test_louvain_simple.py not found")
+            logger.error("Failed to import run_louvain_fast - test_louvain_simple.py not found")
             return jsonify({"success": False, "error": "Louvain algorithm not available"}), 500
         
         # Prepare graph data
@@ -538,45 +715,60 @@ def run_louvain_community_detection():
         
         # Run Louvain algorithm
         try:
-            results = run_louvain_algorithm(graph_data, resolution=resolution)
+            results = run_louvain_fast(graph_data, resolution=resolution)
         except Exception as e:
-            logger.error(f"Louvain algorithm execution failed: {e}")
+            logger.error("Louvain algorithm execution failed: %s", e)
             logger.error(traceback.format_exc())
             return jsonify({"success": False, "error": f"Algorithm execution failed: {str(e)}"}), 500
         
-        # Format response (remove NetworkX graph object)
+        # Format response (remove NetworkX graph object); community ids are
+        # emitted as JSON string keys by the serializer
         response_data = {
             "partition": results["partition"],
-            "communities": {str(k): v for k, v in results["communities"].items()},
+            "communities": results["communities"],
             "modularity": results["modularity"],
             "num_communities": results["num_communities"]
         }
         
-        logger.info(f"Louvain completed: {results['num_communities']} communities, modularity={results['modularity']:.4f}")
+        logger.info("Louvain completed: %s communities, modularity=%.4f", results['num_communities'], results['modularity'])
         
-        return jsonify({"success": True, "data": response_data}), 200
+        return _json_response({"success": True, "data": response_data})
         
     except Exception as e:
-        logger.error(f"Error in Louvain endpoint: {e}")
+        logger.error("Error in Louvain endpoint: %s", e)
         logger.error(traceback.format_exc())
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
 
+@app.before_request
+def reject_oversized_body():
+    # Check the declared length up front so the route handlers' generic
+    # exception handling never turns an oversized upload into a 500
+    max_length = app.config.get('MAX_CONTENT_LENGTH')
+    if max_length and (request.content_length or 0) > max_length:
+        abort(413)
+
+
+@app.errorhandler(413)
+def request_too_large(error):
+    logger.warning("413 error: %s (%s bytes)", request.path, request.content_length)
+    return jsonify({"success": False, "error": "Request body too large"}), 413
+
+
 @app.errorhandler(404)
 def not_found(error):
-    logger.warning(f"404 error: {request.url}")
+    logger.warning("404 error: %s", request.url)
     return jsonify({"error": "Not found", "path": request.path}), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
-    logger.error(f"500 error: {error}")
+    logger.error("500 error: %s", error)
     return jsonify({"error": "Internal server error"}), 500
 
 
 def get_current_timestamp():
-    from datetime import datetime
     return datetime.now().isoformat()
 
 
@@ -587,4 +779,6 @@ def create_app(config=None):
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Development server only; in production run under gunicorn:
+    #   gunicorn -c gunicorn.conf.py "src.api:create_app()"
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1", host='0.0.0.0', port=5001)
@@ -7,6 +7,7 @@ import logging
 import yaml
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .data_ingestion import BaseDataIngestor, Neo4jDataIngestor, JSONDataIngestor
 from .anomaly_detection import (
@@ -18,6 +19,7 @@ from .anomaly_detection import (
 from .risk_scoring import RiskScorer
 from .visualization import NetworkVisualizer, GephiExporter, ChartGenerator
 from .threat_intelligence import ThreatIntelligenceManager
+from .utils import DataValidator
 
 logger = logging.getLogger(__name__)
 
@@ -200,6 +202,10 @@ class ChainBreak:
                 logger.warning(f"Data ingestion failed for address {address}")
                 return self._get_analysis_error_result(address, "Data ingestion failed")
 
+            # Newly ingested transactions can change scores of this address and its neighbours
+            if self.risk_scorer:
+                self.risk_scorer.invalidate_neighbourhood(address)
+
             # Step 2: Detect anomalies (only if Neo4j backend available)
             anomalies = {}
             if self.is_neo4j_available():
@@ -292,32 +298,12 @@ class ChainBreak:
                 logger.info("Step 3.5: Threat intelligence not available")
 
             # Step 4: Generate visualizations if requested and available
-            visualizations = {}
-            if generate_visualizations and self.is_neo4j_available():
+            if generate_visualizations:
                 logger.info("Step 4: Generating visualizations...")
-                try:
-                    # Network visualization
-                    network_graph = self.visualizer.visualize_address_network(
-                        address)
-                    visualizations['network_graph'] = network_graph
-
-                    # Transaction timeline
-                    self.visualizer.create_transaction_timeline(address)
-                    visualizations['timeline_created'] = True
-
-                    # Risk heatmap - get risk score for the address
-                    risk_score = self.risk_scorer.calculate_risk_score(address)
-                    self.visualizer.create_risk_heatmap([address], [risk_score])
-                    visualizations['risk_heatmap_created'] = True
-
-                except Exception as e:
-                    logger.warning(
-                        f"Visualization generation failed: {str(e)}")
-                    visualizations['error'] = str(e)
+                visualizations = self.create_visualizations(address)
             else:
-                logger.info(
-                    "Step 4: Skipping visualizations (JSON backend mode or not requested)")
-                visualizations['message'] = 'Visualizations not available in JSON mode'
+                logger.info("Step 4: Skipping visualizations (not requested)")
+                visualizations = {'message': 'Visualizations not available in JSON mode'}
 
             # Step 5: Compile results
             logger.info("Step 5: Compiling analysis results...")
@@ -343,34 +329,103 @@ class ChainBreak:
             logger.error(f"Analysis failed for address {address}: {str(e)}")
             return self._get_analysis_error_result(address, str(e))
 
-    def analyze_multiple_addresses(self, addresses: List[str], blockchain: str = 'btc') -> Dict[str, Any]:
-        """Analyze multiple addresses"""
+    def create_visualizations(self, address: str) -> Dict[str, Any]:
+        """Generate the network graph, transaction timeline and risk heatmap for an address"""
+        visualizations = {}
+        if not self.is_neo4j_available():
+            logger.info("Skipping visualizations (JSON backend mode)")
+            visualizations['message'] = 'Visualizations not available in JSON mode'
+            return visualizations
+
         try:
+            # Network visualization
+            network_graph = self.visualizer.visualize_address_network(
+                address)
+            visualizations['network_graph'] = network_graph
+
+            # Transaction timeline
+            self.visualizer.create_transaction_timeline(address)
+            visualizations['timeline_created'] = True
+
+            # Risk heatmap - get risk score for the address
+            risk_score = self.risk_scorer.calculate_risk_score(address)
+            self.visualizer.create_risk_heatmap([address], [risk_score])
+            visualizations['risk_heatmap_created'] = True
+
+        except Exception as e:
+            logger.warning(
+                f"Visualization generation failed: {str(e)}")
+            visualizations['error'] = str(e)
+
+        return visualizations
+
+    def analyze_multiple_addresses(self, addresses: List[str], blockchain: str = 'btc',
+                                   max_workers: int = 16) -> Dict[str, Any]:
+        """Analyze multiple addresses concurrently
+
+        Each analysis is dominated by blockchain API and database I/O, so
+        addresses are analyzed on a bounded thread pool; max_workers caps the
+        number of in-flight upstream requests. Duplicate addresses are
+        analyzed once. Bitcoin addresses are format-checked as one vectorized
+        batch up front, and invalid ones are reported as failures without
+        being analyzed.
+
+        Sharing the components across workers is safe: the Neo4j driver hands
+        each session its own pooled connection, the risk scorer's score cache
+        is lock-guarded, the volume detector fits a per-call model copy, and
+        the remaining detectors and threat intel clients keep no per-call
+        state beyond their requests sessions.
+        """
+        try:
+            if blockchain == 'btc':
+                valid = DataValidator.validate_bitcoin_addresses(addresses)
+                invalid_addresses = {address for address, ok in zip(addresses, valid) if not ok}
+            else:
+                invalid_addresses = set()
+
+            unique_addresses = list(dict.fromkeys(addresses))
             logger.info(
-                f"Starting batch analysis for {len(addresses)} addresses")
+                f"Starting batch analysis for {len(unique_addresses)} addresses")
 
             results = {}
             successful_analyses = 0
             failed_analyses = 0
 
-            for address in addresses:
-                try:
-                    result = self.analyze_address(
-                        address, blockchain, generate_visualizations=False)
-                    if 'error' not in result:
-                        results[address] = result
-                        successful_analyses += 1
-                    else:
-                        results[address] = {'error': result['error']}
-                        failed_analyses += 1
-                except Exception as e:
-                    logger.error(
-                        f"Analysis failed for address {address}: {str(e)}")
-                    results[address] = {'error': str(e)}
+            for address in unique_addresses:
+                if address in invalid_addresses:
+                    results[address] = {'error': 'Invalid Bitcoin address'}
                     failed_analyses += 1
 
+            to_analyze = [address for address in unique_addresses if address not in invalid_addresses]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_analyze)))) as executor:
+                future_to_address = {
+                    executor.submit(self.analyze_address, address, blockchain,
+                                    generate_visualizations=False): address
+                    for address in to_analyze
+                }
+
+                for future in as_completed(future_to_address):
+                    address = future_to_address[future]
+                    try:
+                        result = future.result()
+                        if 'error' not in result:
+                            results[address] = result
+                            successful_analyses += 1
+                        else:
+                            results[address] = {'error': result['error']}
+                            failed_analyses += 1
+                    except Exception as e:
+                        logger.error(
+                            f"Analysis failed for address {address}: {str(e)}")
+                        results[address] = {'error': str(e)}
+                        failed_analyses += 1
+
+            # Keep results in request order regardless of completion order
+            results = {address: results[address] for address in unique_addresses}
+
             batch_results = {
-                'addresses_analyzed': len(addresses),
+                'addresses_analyzed': len(unique_addresses),
+                'duplicates_skipped': len(addresses) - len(unique_addresses),
                 'successful_analyses': successful_analyses,
                 'failed_analyses': failed_analyses,
                 'blockchain': blockchain,
@@ -399,7 +454,7 @@ class ChainBreak:
                 output_file = f"network_{address}_{self._get_current_timestamp()}.gexf"
 
             export_file = self.gephi_exporter.export_address_subgraph(
-                address, output_file)
+                address, output_file=output_file)
             logger.info(f"Network exported to Gephi format: {export_file}")
             return export_file
 
@@ -4,13 +4,28 @@ import logging
 import time
 import requests
 import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 from functools import lru_cache
-import hashlib
+
+from .graph_build import add_transactions
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +36,27 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 logger.info(f"BlockchainComFetcher using data directory: {DATA_DIR.resolve()}")
 
+# Precompiled validation patterns (P2PKH, P2SH, Bech32 addresses; 64-char hex hashes)
+_ADDR_RE = re.compile(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$|^bc1[a-z0-9]{39,59}$')
+_HASH_RE = re.compile(r'^[a-fA-F0-9]{64}$')
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9_\-]')
+
+
+# Addresses and hashes are re-queried often; bounded caches memoize both
+# valid and invalid results without growing without limit
+@lru_cache(maxsize=2048)
+def _is_valid_address(address: str) -> bool:
+    return _ADDR_RE.match(address) is not None
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_hash(value: str) -> bool:
+    return _HASH_RE.match(value) is not None
+
+
+# In-memory response cache key: (url, sorted params or None)
+CacheKey = Tuple[str, Optional[Tuple[Tuple[str, Any], ...]]]
+
 
 @dataclass
 class GraphNode:
@@ -89,9 +125,11 @@ class FetcherConfig:
     timeout: int = 20
     max_retries: int = 3
     backoff_factor: float = 0.3
+    pool_maxsize: int = 32  # keep-alive connections to blockchain.info
     cache_enabled: bool = True
     cache_ttl: int = 300  # 5 minutes
-    max_cache_size: int = 1000
+    max_cache_size: int = 1000  # may briefly hold up to 2x before a batch eviction
+    stream_min_bytes: int = 1 << 20  # smaller (or unsized) address responses are parsed whole and cached
     data_dir: Optional[Path] = None
 
 
@@ -104,12 +142,16 @@ class BlockchainComFetcher:
         self.config = config or FetcherConfig()
         self.session = session or self._create_session(
             self.config.max_retries,
-            self.config.backoff_factor
+            self.config.backoff_factor,
+            self.config.pool_maxsize
         )
 
-        # Initialize cache
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_timestamps: Dict[str, float] = {}
+        # Initialize cache: key -> (last-use tick, expires_at, data); the lock
+        # guards every read-modify-write since fetch_many/fetch_addresses and
+        # the API's thread pools share one fetcher
+        self._cache: Dict[CacheKey, Tuple[int, float, Dict[str, Any]]] = {}
+        self._tick = 0
+        self._cache_lock = threading.Lock()
 
         # Update data directory if specified in config
         if self.config.data_dir:
@@ -117,7 +159,13 @@ class BlockchainComFetcher:
             DATA_DIR = self.config.data_dir
             DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-        self._last_request_time = 0.0
+        # Token bucket rate limiter: bursts up to capacity, refilled at 1/rate_limit_s
+        rate_limit_s = max(self.config.rate_limit_s, 1e-6)
+        self._refill_rate = 1.0 / rate_limit_s
+        self._capacity = float(max(1, int(self._refill_rate)))
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
 
     @classmethod
     def from_config_file(cls, config_path: Union[str, Path]) -> "BlockchainComFetcher":
@@ -132,65 +180,96 @@ class BlockchainComFetcher:
         config = FetcherConfig(**config_data)
         return cls(config=config)
 
-    def _get_cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
-        """Generate cache key for URL and parameters"""
-        key_data = f"{url}|{json.dumps(params or {}, sort_keys=True)}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    def _get_cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        """Generate cache key for URL and parameters
+
+        A plain tuple hashes far faster than md5 over a JSON dump and needs no
+        collision resistance for an in-process cache.
+        """
+        if not params:
+            return (url, None)
+        return (url, tuple(sorted(params.items())))
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache entry is still valid"""
+    def _get_cached_response(self, cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Get cached response if valid"""
         if not self.config.cache_enabled:
-            return False
+            return None
 
-        if cache_key not in self._cache_timestamps:
-            return False
+        with self._cache_lock:
+            # Single lookup; expiry is one float compare against the stored deadline
+            entry = self._cache.get(cache_key)
+            if entry is None or entry[1] <= time.time():
+                return None
 
-        age = time.time() - self._cache_timestamps[cache_key]
-        return age < self.config.cache_ttl
+            # Mark as most recently used by bumping the tick, no reordering
+            self._tick += 1
+            _, expires_at, data = entry
+            self._cache[cache_key] = (self._tick, expires_at, data)
 
-    def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get cached response if valid"""
-        if self._is_cache_valid(cache_key):
-            logger.debug(f"Cache hit for key: {cache_key}")
-            return self._cache.get(cache_key)
-        return None
+        logger.debug(f"Cache hit for key: {cache_key}")
+        return data
 
-    def _cache_response(self, cache_key: str, data: Dict[str, Any]) -> None:
+    def _cache_response(self, cache_key: CacheKey, data: Dict[str, Any]) -> None:
         """Cache response data"""
         if not self.config.cache_enabled:
             return
 
-        # Implement LRU-style cache eviction
-        if len(self._cache) >= self.config.max_cache_size:
-            # Remove oldest entry
-            oldest_key = min(self._cache_timestamps, key=self._cache_timestamps.get)
-            del self._cache[oldest_key]
-            del self._cache_timestamps[oldest_key]
+        with self._cache_lock:
+            self._tick += 1
+            self._cache[cache_key] = (self._tick, time.time() + self.config.cache_ttl, data)
 
-        self._cache[cache_key] = data
-        self._cache_timestamps[cache_key] = time.time()
+            # Lazy LRU: let the cache grow to twice its size, then drop the least
+            # recently used half in one pass (amortized O(1) per insert)
+            if len(self._cache) > 2 * self.config.max_cache_size:
+                self._evict_lru()
         logger.debug(f"Cached response for key: {cache_key}")
 
+    def _evict_lru(self) -> None:
+        """Trim the cache back to max_cache_size (caller holds _cache_lock)
+
+        Expired entries go first since they are dead weight anyway; only the
+        remaining excess is taken from the least recently used end.
+        """
+        now = time.time()
+        items = list(self._cache.items())
+        expired = [key for key, (_, expires_at, _) in items if expires_at <= now]
+        for key in expired:
+            del self._cache[key]
+
+        excess = len(self._cache) - self.config.max_cache_size
+        if excess > 0:
+            live = [item for item in items if item[1][1] > now]
+            live.sort(key=lambda item: item[1][0])
+            for key, _ in live[:excess]:
+                del self._cache[key]
+        logger.debug(f"Evicted {len(expired)} expired and {max(excess, 0)} LRU cache entries")
+
     def clear_cache(self) -> None:
         """Clear all cached data"""
-        self._cache.clear()
-        self._cache_timestamps.clear()
+        with self._cache_lock:
+            self._cache.clear()
         logger.info("Cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        with self._cache_lock:
+            expiries = [exp for _, exp, _ in self._cache.values()]
         return {
             "cache_enabled": self.config.cache_enabled,
-            "cache_size": len(self._cache),
+            "cache_size": len(expiries),
             "max_cache_size": self.config.max_cache_size,
             "cache_ttl": self.config.cache_ttl,
-            "oldest_entry_age": min(self._cache_timestamps.values()) if self._cache_timestamps else 0,
-            "newest_entry_age": max(self._cache_timestamps.values()) if self._cache_timestamps else 0
+            "oldest_entry_age": min(expiries) - self.config.cache_ttl if expiries else 0,
+            "newest_entry_age": max(expiries) - self.config.cache_ttl if expiries else 0
         }
 
-    def _create_session(self, max_retries: int, backoff_factor: float) -> requests.Session:
+    def _create_session(self, max_retries: int, backoff_factor: float, pool_maxsize: int = 32) -> requests.Session:
         """Create a session with retry strategy and connection pooling"""
         session = requests.Session()
+        session.headers.update({
+            "Connection": "keep-alive",
+            "User-Agent": "ChainBreak/1.0 (+BlockchainComFetcher)"
+        })
 
         # Use allowed_methods instead of deprecated method_whitelist for newer requests versions
         retry_kwargs = {
@@ -212,7 +291,14 @@ class BlockchainComFetcher:
                 **retry_kwargs
             )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # All traffic goes to a single host, so one pool sized for concurrent
+        # fetches keeps TLS connections alive instead of discarding them
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy,
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -224,7 +310,7 @@ class BlockchainComFetcher:
             raise InvalidAddressError(f"Invalid address: {address}")
 
         # Basic validation for Bitcoin addresses (P2PKH, P2SH, Bech32)
-        if not re.match(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$|^bc1[a-z0-9]{39,59}$', address):
+        if not _is_valid_address(address):
             raise InvalidAddressError(f"Invalid Bitcoin address format: {address}")
 
     def _validate_tx_hash(self, tx_hash: str) -> None:
@@ -232,7 +318,7 @@ class BlockchainComFetcher:
         if not tx_hash or not isinstance(tx_hash, str):
             raise TransactionNotFoundError(f"Invalid transaction hash: {tx_hash}")
 
-        if not re.match(r'^[a-fA-F0-9]{64}$', tx_hash):
+        if not _is_valid_hash(tx_hash):
             raise TransactionNotFoundError(f"Invalid transaction hash format: {tx_hash}")
 
     def _validate_block_hash(self, block_hash: str) -> None:
@@ -240,20 +326,25 @@ class BlockchainComFetcher:
         if not block_hash or not isinstance(block_hash, str):
             raise BlockNotFoundError(f"Invalid block hash: {block_hash}")
 
-        if not re.match(r'^[a-fA-F0-9]{64}$', block_hash):
+        if not _is_valid_hash(block_hash):
             raise BlockNotFoundError(f"Invalid block hash format: {block_hash}")
 
     def _rate_limit_wait(self) -> None:
-        """Enforce rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """Enforce rate limiting with a token bucket"""
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+            # Take a token; a negative balance is the wait owed by this caller
+            self._tokens -= 1.0
+            sleep_time = -self._tokens / self._refill_rate if self._tokens < 0 else 0.0
 
-        if time_since_last < self.config.rate_limit_s:
-            sleep_time = self.config.rate_limit_s - time_since_last
+        if sleep_time > 0:
             time.sleep(sleep_time)
 
-        self._last_request_time = time.time()
-
     def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make HTTP GET request with caching, error handling and rate limiting"""
         cache_key = self._get_cache_key(url, params)
@@ -270,7 +361,8 @@ class BlockchainComFetcher:
             response = self.session.get(url, params=params, timeout=self.config.timeout)
             response.raise_for_status()
 
-            data = response.json()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, handled below
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             logger.debug(f"Successfully fetched data from {url}")
 
             # Cache the response
@@ -279,18 +371,7 @@ class BlockchainComFetcher:
             return data
 
         except requests.exceptions.HTTPError as e:
-            if hasattr(response, 'status_code') and response.status_code == 429:
-                raise RateLimitError(f"Rate limit exceeded for {url}") from e
-            elif hasattr(response, 'status_code') and response.status_code == 404:
-                if "rawtx" in url:
-                    raise TransactionNotFoundError(f"Transaction not found: {url.split('/')[-1]}") from e
-                elif "rawblock" in url:
-                    raise BlockNotFoundError(f"Block not found: {url.split('/')[-1]}") from e
-                else:
-                    raise BlockchainAPIError(f"Resource not found: {url}") from e
-            else:
-                status_code = getattr(response, 'status_code', 'unknown')
-                raise BlockchainAPIError(f"HTTP error {status_code} for {url}: {e}") from e
+            raise self._http_error(url, e.response, e) from e
 
         except requests.exceptions.Timeout as e:
             raise BlockchainAPIError(f"Request timeout for {url}") from e
@@ -305,150 +386,187 @@ class BlockchainComFetcher:
             logger.error(f"Unexpected error fetching {url}: {e}")
             raise BlockchainAPIError(f"Unexpected error: {e}") from e
 
+    @staticmethod
+    def _http_error(url: str, response: Optional[requests.Response], error: Exception) -> BlockchainAPIError:
+        """Map an HTTP error response to the matching BlockchainAPIError subclass"""
+        status_code = getattr(response, 'status_code', 'unknown')
+        if status_code == 429:
+            return RateLimitError(f"Rate limit exceeded for {url}")
+        if status_code == 404:
+            if "rawtx" in url:
+                return TransactionNotFoundError(f"Transaction not found: {url.split('/')[-1]}")
+            if "rawblock" in url:
+                return BlockNotFoundError(f"Block not found: {url.split('/')[-1]}")
+            return BlockchainAPIError(f"Resource not found: {url}")
+        return BlockchainAPIError(f"HTTP error {status_code} for {url}: {error}")
+
     def fetch_tx(self, tx_hash: str) -> Dict[str, Any]:
         """Fetch transaction data by hash"""
         self._validate_tx_hash(tx_hash)
         url = f"{BLOCKCHAIN_BASE}/rawtx/{tx_hash}"
         return self._get(url)
 
-    def fetch_address(self, address: str, limit: int = 50) -> Dict[str, Any]:
-        """Fetch address data with transaction history"""
+    def _address_request(self, address: str, limit: int) -> Tuple[str, Dict[str, Any]]:
+        """Validate an address query and return its URL and params"""
         self._validate_address(address)
         if limit < 1 or limit > 1000:
             raise ValueError(f"Limit must be between 1 and 1000, got {limit}")
 
-        url = f"{BLOCKCHAIN_BASE}/rawaddr/{address}"
-        params = {"limit": limit}
+        return f"{BLOCKCHAIN_BASE}/rawaddr/{address}", {"limit": limit}
+
+    def fetch_address(self, address: str, limit: int = 50) -> Dict[str, Any]:
+        """Fetch address data with transaction history"""
+        url, params = self._address_request(address, limit)
         return self._get(url, params=params)
 
+    def fetch_address_stream(self, address: str, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """Yield an address's transactions one at a time as they are parsed (requires ijson)
+
+        Only responses declaring a Content-Length of at least
+        config.stream_min_bytes are stream-parsed, keeping peak memory at
+        roughly one transaction; those are not cached. Smaller or unsized
+        responses are parsed whole and cached exactly like fetch_address.
+        """
+        if not IJSON_AVAILABLE:
+            raise ImportError("ijson is required for streaming address fetches")
+
+        url, params = self._address_request(address, limit)
+        return self._stream_txs(url, params)
+
+    def _stream_txs(self, url: str, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Stream-parse the txs array of a rawaddr response"""
+        cache_key = self._get_cache_key(url, params)
+        cached_data = self._get_cached_response(cache_key)
+        if cached_data is not None:
+            yield from cached_data.get("txs", [])
+            return
+
+        self._rate_limit_wait()
+        logger.debug(f"Streaming request to {url} with params {params}")
+
+        try:
+            with self.session.get(url, params=params, timeout=self.config.timeout, stream=True) as response:
+                response.raise_for_status()
+
+                declared_size = int(response.headers.get("Content-Length") or 0)
+                if declared_size < self.config.stream_min_bytes:
+                    # Not worth streaming: parse whole so the response cache stays warm
+                    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+                    self._cache_response(cache_key, data)
+                    yield from data.get("txs", [])
+                    return
+
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "txs.item", use_float=True)
+
+        except requests.exceptions.HTTPError as e:
+            raise self._http_error(url, e.response, e) from e
+
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            raise BlockchainAPIError(f"Connection error for {url}") from e
+
+        except (ijson.JSONError, json.JSONDecodeError) as e:
+            raise BlockchainAPIError(f"Invalid JSON response from {url}") from e
+
     def fetch_block(self, block_hash: str) -> Dict[str, Any]:
         """Fetch block data by hash"""
         self._validate_block_hash(block_hash)
         url = f"{BLOCKCHAIN_BASE}/rawblock/{block_hash}"
         return self._get(url)
 
-    def build_graph_for_address(self, address: str, tx_limit: int = 50) -> Dict[str, Any]:
-        """Build optimized graph data for an address with better performance"""
-        logger.info(f"Building graph for address {address} with limit {tx_limit}")
+    def fetch_many(self, tx_hashes: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch several transactions concurrently, keyed by hash; failed fetches are skipped"""
+        return self._fetch_concurrently(self.fetch_tx, tx_hashes, max_workers)
 
-        data = self.fetch_address(address, limit=tx_limit)
-        transactions = data.get("txs", [])
+    def fetch_addresses(
+        self,
+        addresses: List[str],
+        limit: int = 50,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch several addresses concurrently, keyed by address; failed fetches are skipped"""
+        return self._fetch_concurrently(
+            lambda address: self.fetch_address(address, limit=limit), addresses, max_workers
+        )
 
-        if not transactions:
-            logger.warning(f"No transactions found for address {address}")
-            return self._create_empty_graph(address)
+    def _fetch_concurrently(
+        self,
+        fetch_fn: Callable[[str], Dict[str, Any]],
+        keys: List[str],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run fetch_fn over unique keys in a thread pool; the token bucket gates admission"""
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        workers = max_workers or min(16, self.config.pool_maxsize)
+        results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique_keys))) as executor:
+            futures = {executor.submit(fetch_fn, key): key for key in unique_keys}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except BlockchainAPIError as e:
+                    logger.warning(f"Skipping {key}: {e}")
+        return results
+
+    def build_graph_for_address(self, address: str, tx_limit: int = 50, hops: int = 1) -> Dict[str, Any]:
+        """Build optimized graph data for an address with better performance
+
+        With hops=2 the transactions of every counterparty address found in the
+        first pass are fetched concurrently and merged into the graph.
+        """
+        logger.info(f"Building graph for address {address} with limit {tx_limit}")
 
-        # Use sets for O(1) lookups and deduplication
-        nodes_set = set()
-        edges_list = []
+        if IJSON_AVAILABLE:
+            # Consume transactions as they are parsed; small responses come from / go to the cache
+            transactions: Iterable[Dict[str, Any]] = self.fetch_address_stream(address, limit=tx_limit)
+        else:
+            transactions = self.fetch_address(address, limit=tx_limit).get("txs", [])
 
-        # Pre-allocate collections for better performance
+        # Dicts give O(1) membership and deduplication while keeping insertion order
         nodes_dict = {}
-        edges_dict = {}  # For deduplication
+        edges_dict = {}
 
         # Add the main address node
-        main_node = GraphNode(id=address, label=address[:12], type="address")
-        nodes_dict[address] = main_node
-        nodes_set.add(address)
-
-        processed_txs = 0
-        total_inputs = 0
-        total_outputs = 0
-
-        for tx in transactions:
-            txid = tx.get("hash")
-            if not txid:
-                continue
-
-            processed_txs += 1
-
-            # Add transaction node
-            if txid not in nodes_set:
-                tx_node = GraphNode(id=txid, label=txid[:12], type="transaction")
-                nodes_dict[txid] = tx_node
-                nodes_set.add(txid)
-
-            # Process inputs
-            for vin in tx.get("inputs", []):
-                prev_out = vin.get("prev_out") or {}
-                src_addr = prev_out.get("addr")
-                if not src_addr:
-                    continue
-
-                total_inputs += 1
-
-                # Add source address node
-                if src_addr not in nodes_set:
-                    src_node = GraphNode(id=src_addr, label=src_addr[:12], type="address")
-                    nodes_dict[src_addr] = src_node
-                    nodes_set.add(src_addr)
-
-                # Create edge with deduplication
-                edge_id = f"{src_addr}->{txid}"
-                if edge_id not in edges_dict:
-                    edge = GraphEdge(
-                        id=edge_id,
-                        source=src_addr,
-                        target=txid,
-                        type="SENT_FROM",
-                        value=prev_out.get("value", 0)
-                    )
-                    edges_list.append(edge)
-                    edges_dict[edge_id] = edge
-
-            # Process outputs
-            for vout in tx.get("out", []):
-                dst_addr = vout.get("addr")
-                if not dst_addr:
-                    continue
-
-                total_outputs += 1
-
-                # Add destination address node
-                if dst_addr not in nodes_set:
-                    dst_node = GraphNode(id=dst_addr, label=dst_addr[:12], type="address")
-                    nodes_dict[dst_addr] = dst_node
-                    nodes_set.add(dst_addr)
-
-                # Create edge with deduplication
-                edge_id = f"{txid}->{dst_addr}"
-                if edge_id not in edges_dict:
-                    edge = GraphEdge(
-                        id=edge_id,
-                        source=txid,
-                        target=dst_addr,
-                        type="SENT_TO",
-                        value=vout.get("value", 0)
-                    )
-                    edges_list.append(edge)
-                    edges_dict[edge_id] = edge
-
-        # Convert to final format
-        graph_data = GraphData(
-            nodes=list(nodes_dict.values()),
-            edges=edges_list,
-            meta=GraphMeta(
-                address=address,
-                tx_count=len(transactions),
-                node_count=len(nodes_dict),
-                edge_count=len(edges_list)
-            )
+        nodes_dict[address] = {"id": address, "label": address[:12], "type": "address"}
+
+        tx_count, processed_txs = add_transactions(
+            transactions, nodes_dict, edges_dict
         )
 
+        if not tx_count:
+            logger.warning(f"No transactions found for address {address}")
+            return self._create_empty_graph(address)
+
+        if hops > 1:
+            neighbours = [
+                node_id for node_id, node in nodes_dict.items()
+                if node["type"] == "address" and node_id != address
+            ]
+            for neighbour_data in self.fetch_addresses(neighbours, limit=tx_limit).values():
+                neighbour_tx_count, neighbour_processed = add_transactions(
+                    neighbour_data.get("txs", []), nodes_dict, edges_dict
+                )
+                tx_count += neighbour_tx_count
+                processed_txs += neighbour_processed
+
         logger.info(
-            f"Graph built: {len(nodes_dict)} nodes, {len(edges_list)} edges, "
+            f"Graph built: {len(nodes_dict)} nodes, {len(edges_dict)} edges, "
             f"{processed_txs} transactions processed"
         )
 
-        # Return dict format for backward compatibility
+        # Node and edge dicts are built in their final shape, so no second pass is needed
         return {
-            "nodes": [{"id": n.id, "label": n.label, "type": n.type} for n in graph_data.nodes],
-            "edges": [{"id": e.id, "source": e.source, "target": e.target, "type": e.type, "value": e.value} for e in graph_data.edges],
+            "nodes": list(nodes_dict.values()),
+            "edges": list(edges_dict.values()),
             "meta": {
-                "address": graph_data.meta.address,
-                "tx_count": graph_data.meta.tx_count,
-                "node_count": graph_data.meta.node_count,
-                "edge_count": graph_data.meta.edge_count
+                "address": address,
+                "tx_count": tx_count,
+                "node_count": len(nodes_dict),
+                "edge_count": len(edges_dict)
             }
         }
 
@@ -473,15 +591,19 @@ class BlockchainComFetcher:
         if not filename:
             base = graph.get("meta", {}).get("address", "graph")
             # Sanitize filename - only allow alphanumeric, underscore, hyphen
-            safe_base = re.sub(r'[^A-Za-z0-9_\-]', '_', base)
+            safe_base = _UNSAFE_FILENAME_RE.sub('_', base)
             filename = f"graph_{safe_base[:12]}.json"
 
         path = data_dir / filename
 
         # Use temporary file for atomic write
         tmp = str(path) + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(graph, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(graph, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(graph, f, ensure_ascii=False, indent=2)
 
         os.replace(tmp, path)
 
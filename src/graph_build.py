@@ -0,0 +1,82 @@
+"""
+Graph construction from blockchain.info transaction data
+
+Kept free of other project imports and fully annotated so it can be compiled
+with mypyc (see setup.py); it runs unchanged as plain Python.
+"""
+
+from typing import Any, Dict, Iterable, Tuple
+
+NodeMap = Dict[str, Dict[str, Any]]
+EdgeMap = Dict[str, Dict[str, Any]]
+
+
+def add_transactions(
+    transactions: Iterable[Dict[str, Any]],
+    nodes_dict: NodeMap,
+    edges_dict: EdgeMap
+) -> Tuple[int, int]:
+    """Add transaction, address and flow edges to the graph
+
+    Accepts any iterable so streamed transactions are consumed in one pass.
+    Returns (transactions seen, transactions processed).
+    """
+    tx_count = 0
+    processed_txs = 0
+
+    for tx in transactions:
+        tx_count += 1
+        txid: str = tx.get("hash") or ""
+        if not txid:
+            continue
+
+        processed_txs += 1
+
+        # Add transaction node
+        if txid not in nodes_dict:
+            nodes_dict[txid] = {"id": txid, "label": txid[:12], "type": "transaction"}
+
+        # Process inputs
+        for vin in tx.get("inputs", []):
+            prev_out = vin.get("prev_out") or {}
+            src_addr: str = prev_out.get("addr") or ""
+            if not src_addr:
+                continue
+
+            # Add source address node
+            if src_addr not in nodes_dict:
+                nodes_dict[src_addr] = {"id": src_addr, "label": src_addr[:12], "type": "address"}
+
+            # Create edge with deduplication
+            edge_id = f"{src_addr}->{txid}"
+            if edge_id not in edges_dict:
+                edges_dict[edge_id] = {
+                    "id": edge_id,
+                    "source": src_addr,
+                    "target": txid,
+                    "type": "SENT_FROM",
+                    "value": prev_out.get("value", 0)
+                }
+
+        # Process outputs
+        for vout in tx.get("out", []):
+            dst_addr: str = vout.get("addr") or ""
+            if not dst_addr:
+                continue
+
+            # Add destination address node
+            if dst_addr not in nodes_dict:
+                nodes_dict[dst_addr] = {"id": dst_addr, "label": dst_addr[:12], "type": "address"}
+
+            # Create edge with deduplication
+            edge_id = f"{txid}->{dst_addr}"
+            if edge_id not in edges_dict:
+                edges_dict[edge_id] = {
+                    "id": edge_id,
+                    "source": txid,
+                    "target": dst_addr,
+                    "type": "SENT_TO",
+                    "value": vout.get("value", 0)
+                }
+
+    return tx_count, processed_txs
@@ -4,13 +4,48 @@ Calculates comprehensive risk scores for wallet addresses
 """
 
 from neo4j import GraphDatabase
+import copy
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import math
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Large summaries are split into batches that run as concurrent read transactions
+RISK_BATCH_SIZE = 500
+RISK_MAX_WORKERS = 8
+
+# Computed scores are reused for repeated addresses; the TTL keeps them in step
+# with the rolling 1h/24h windows the factor queries look at
+SCORE_CACHE_SIZE = 10000
+SCORE_CACHE_TTL = 300
+
+RISK_LEVELS = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'VERY_LOW')
+
+# Banded score lookups: bisect_left(thresholds, value) counts the thresholds the
+# value strictly exceeds and indexes the matching score, replacing if/elif ladders
+_LEVEL_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)  # inclusive lower bounds, use bisect_right
+_LEVEL_LABELS = ('VERY_LOW', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+_VOLUME_RATIO_BANDS = ((2, 5, 10, 20), (0.3, 0.5, 0.7, 0.85, 0.95))
+_ABSOLUTE_VOLUME_BANDS = ((10000000, 100000000, 1000000000), (0.2, 0.4, 0.6, 0.8))  # 0.1, 1, 10 BTC
+_TX_COUNT_BANDS = ((50, 100, 500, 1000), (0.2, 0.4, 0.6, 0.8, 0.9))
+_LAYERING_BANDS = ((0, 2, 5, 10), (0.1, 0.4, 0.6, 0.8, 0.95))
+_TEMPORAL_BANDS = ((0, 5, 10), (0.1, 0.4, 0.6, 0.8))
+_SMURFING_BANDS = ((4, 10, 20), (0.1, 0.5, 0.7, 0.9))  # tx_count >= 5, > 10, > 20
+
+
+def _band(value: float, bands) -> float:
+    """Return the score of the band that value falls into"""
+    thresholds, scores = bands
+    return scores[bisect_left(thresholds, value)]
+
 
 class RiskScorer:
     """Calculates comprehensive risk scores for addresses"""
@@ -19,73 +54,214 @@ class RiskScorer:
         self.driver = neo4j_driver
         self.config = config
         self.risk_weights = config.get('risk_scoring', {})
+        # address -> (expires_at, risk result), least recently used first
+        self._score_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._score_cache_lock = threading.Lock()
         
     def calculate_address_risk_score(self, address: str) -> Dict[str, Any]:
         """Calculate comprehensive risk score for an address"""
+        logger.info(f"Calculating risk score for address: {address}")
+        return self._score_addresses([address])[address]
+    
+    def invalidate_cache(self, address: Optional[str] = None) -> None:
+        """Drop cached risk scores (all of them, or one address) after the graph changes"""
+        with self._score_cache_lock:
+            if address is None:
+                self._score_cache.clear()
+            else:
+                self._score_cache.pop(address, None)
+    
+    def invalidate_neighbourhood(self, address: str) -> None:
+        """Drop cached risk scores for an address and every address sharing a transaction with it"""
+        query = """
+        MATCH (a:Address {address: $address})-[:PARTICIPATED_IN]-(:Transaction)-[:PARTICIPATED_IN]-(n:Address)
+        RETURN DISTINCT n.address AS address
+        """
         try:
-            logger.info(f"Calculating risk score for address: {address}")
-            
-            # Get address characteristics
-            address_info = self._get_address_info(address)
+            stale = [address] + [record['address'] for record in self._run_query(query, address=address)]
+        except Exception as e:
+            logger.warning(f"Could not look up neighbours of {address}, clearing risk score cache: {str(e)}")
+            self.invalidate_cache()
+            return
+        
+        with self._score_cache_lock:
+            for stale_address in stale:
+                self._score_cache.pop(stale_address, None)
+    
+    def _get_cached_scores(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return unexpired cached scores for the given addresses"""
+        hits = {}
+        now = time.monotonic()
+        with self._score_cache_lock:
+            for address in addresses:
+                entry = self._score_cache.get(address)
+                if entry is None:
+                    continue
+                if entry[0] > now:
+                    self._score_cache.move_to_end(address)
+                    # Deep copy so a caller editing its result, including the nested
+                    # risk_factors/risk_details, cannot alter the cached entry
+                    hits[address] = copy.deepcopy(entry[1])
+                else:
+                    del self._score_cache[address]
+        return hits
+    
+    def _cache_scores(self, scores: Dict[str, Dict[str, Any]]) -> None:
+        """Cache computed scores; fallback results from failed calculations are not kept"""
+        expires_at = time.monotonic() + SCORE_CACHE_TTL
+        with self._score_cache_lock:
+            for address, risk_result in scores.items():
+                if 'error' in risk_result:
+                    continue
+                self._score_cache[address] = (expires_at, copy.deepcopy(risk_result))
+                self._score_cache.move_to_end(address)
+            while len(self._score_cache) > SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+    
+    def _score_addresses(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Score unique addresses, serving repeats from the cache
+
+        Misses get one query per risk factor per batch instead of five per address.
+        """
+        scores_by_address = self._get_cached_scores(addresses)
+        missing = [address for address in addresses if address not in scores_by_address]
+        if not missing:
+            return scores_by_address
+        
+        batches = [missing[i:i + RISK_BATCH_SIZE]
+                   for i in range(0, len(missing), RISK_BATCH_SIZE)]
+        computed = {}
+        if len(batches) <= 1:
+            computed.update(self._calculate_risk_scores_batch(missing))
+        else:
+            # Batches are I/O bound; the driver's pool gives each worker its own connection
+            with ThreadPoolExecutor(max_workers=min(RISK_MAX_WORKERS, len(batches))) as executor:
+                for batch_scores in executor.map(self._calculate_risk_scores_batch, batches):
+                    computed.update(batch_scores)
+        
+        self._cache_scores(computed)
+        scores_by_address.update(computed)
+        return scores_by_address
+    
+    def _calculate_risk_scores_batch(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Calculate risk scores for many addresses with one query per risk factor"""
+        try:
+            address_infos, layering_counts, smurfing_data, rapid_sequences = \
+                self._fetch_risk_data(addresses)
+        except Exception as e:
+            logger.error(f"Error fetching address info for {len(addresses)} addresses: {str(e)}")
+            return {address: self._get_default_risk_score(address) for address in addresses}
+        
+        results = {}
+        for address in addresses:
+            address_info = address_infos.get(address)
             if not address_info:
                 logger.warning(f"No address info found for {address}")
-                return self._get_default_risk_score(address)
-                
-            # Calculate individual risk factors
-            volume_score = self._calculate_volume_risk(address_info)
-            frequency_score = self._calculate_frequency_risk(address_info)
-            layering_score = self._calculate_layering_risk(address)
-            smurfing_score = self._calculate_smurfing_risk(address)
-            temporal_score = self._calculate_temporal_risk(address)
-            
-            # Weighted risk calculation
-            risk_factors = {
-                'volume': volume_score * self.risk_weights.get('volume_weight', 0.3),
-                'frequency': frequency_score * self.risk_weights.get('frequency_weight', 0.2),
-                'layering': layering_score * self.risk_weights.get('layering_weight', 0.3),
-                'smurfing': smurfing_score * self.risk_weights.get('smurfing_weight', 0.2)
-            }
-            
-            # Add temporal risk if available
-            if temporal_score > 0:
-                risk_factors['temporal'] = temporal_score * 0.1
-                # Adjust other weights proportionally
-                total_weight = sum(risk_factors.values())
-                for key in risk_factors:
-                    if key != 'temporal':
-                        risk_factors[key] = risk_factors[key] * (0.9 / (total_weight - risk_factors['temporal']))
-            
-            total_risk_score = sum(risk_factors.values())
-            
-            # Ensure score is between 0 and 1
-            total_risk_score = max(0.0, min(1.0, total_risk_score))
+                results[address] = self._get_default_risk_score(address)
+                continue
             
-            risk_result = {
-                'address': address,
-                'total_risk_score': total_risk_score,
-                'risk_factors': risk_factors,
-                'risk_level': self._classify_risk_level(total_risk_score),
-                'address_info': address_info,
-                'risk_details': {
-                    'volume_risk': volume_score,
-                    'frequency_risk': frequency_score,
-                    'layering_risk': layering_score,
-                    'smurfing_risk': smurfing_score,
-                    'temporal_risk': temporal_score
-                }
+            try:
+                results[address] = self._build_risk_result(
+                    address,
+                    address_info,
+                    0.3 if layering_counts is None else self._layering_score(layering_counts.get(address, 0)),
+                    0.3 if smurfing_data is None else self._smurfing_score(smurfing_data.get(address)),
+                    0.3 if rapid_sequences is None else self._temporal_score(rapid_sequences.get(address, 0))
+                )
+            except Exception as e:
+                logger.error(f"Error calculating risk score for {address}: {str(e)}")
+                results[address] = self._get_default_risk_score(address)
+        
+        return results
+    
+    def _build_risk_result(self, address: str, address_info: Dict[str, Any],
+                           layering_score: float, smurfing_score: float,
+                           temporal_score: float) -> Dict[str, Any]:
+        """Combine the individual risk factors into the final weighted score"""
+        volume_score = self._calculate_volume_risk(address_info)
+        frequency_score = self._calculate_frequency_risk(address_info)
+        
+        # Weighted risk calculation
+        risk_factors = {
+            'volume': volume_score * self.risk_weights.get('volume_weight', 0.3),
+            'frequency': frequency_score * self.risk_weights.get('frequency_weight', 0.2),
+            'layering': layering_score * self.risk_weights.get('layering_weight', 0.3),
+            'smurfing': smurfing_score * self.risk_weights.get('smurfing_weight', 0.2)
+        }
+        
+        # Add temporal risk if available
+        if temporal_score > 0:
+            risk_factors['temporal'] = temporal_score * 0.1
+            # Adjust other weights proportionally
+            total_weight = sum(risk_factors.values())
+            for key in risk_factors:
+                if key != 'temporal':
+                    risk_factors[key] = risk_factors[key] * (0.9 / (total_weight - risk_factors['temporal']))
+        
+        total_risk_score = sum(risk_factors.values())
+        
+        # Ensure score is between 0 and 1
+        total_risk_score = max(0.0, min(1.0, total_risk_score))
+        
+        risk_result = {
+            'address': address,
+            'total_risk_score': total_risk_score,
+            'risk_factors': risk_factors,
+            'risk_level': self._classify_risk_level(total_risk_score),
+            'address_info': address_info,
+            'risk_details': {
+                'volume_risk': volume_score,
+                'frequency_risk': frequency_score,
+                'layering_risk': layering_score,
+                'smurfing_risk': smurfing_score,
+                'temporal_risk': temporal_score
             }
-            
-            logger.info(f"Risk score calculated for {address}: {total_risk_score:.3f} ({risk_result['risk_level']})")
-            return risk_result
-            
+        }
+        
+        logger.info(f"Risk score calculated for {address}: {total_risk_score:.3f} ({risk_result['risk_level']})")
+        return risk_result
+    
+    def _session(self):
+        """Open a session on the configured database, skipping home-database discovery"""
+        return self.driver.session(database=self.config.get('neo4j', {}).get('database'))
+    
+    def _run_query(self, query: str, **params) -> List[Any]:
+        """Run a query in its own auto-commit session"""
+        with self._session() as session:
+            return list(session.run(query, **params))
+    
+    def _fetch_risk_data(self, addresses: List[str]) -> Tuple[Dict[str, Any], ...]:
+        """Run every risk query for the batch inside one read transaction
+
+        If the shared transaction fails (a failed query aborts it), the queries
+        are retried in separate sessions so one bad factor only costs that factor.
+        """
+        try:
+            with self._session() as session:
+                return session.execute_read(self._read_risk_data, addresses)
         except Exception as e:
-            logger.error(f"Error calculating risk score for {address}: {str(e)}")
-            return self._get_default_risk_score(address)
+            logger.warning(f"Risk read transaction failed, retrying queries individually: {str(e)}")
+            return self._read_risk_data(None, addresses)
+    
+    def _read_risk_data(self, tx, addresses: List[str]) -> Tuple[Dict[str, Any], ...]:
+        """Fetch address info and all risk factor data, on tx if given"""
+        run = (lambda query, **params: list(tx.run(query, **params))) if tx is not None else self._run_query
+        # A failed query aborts the shared transaction, so factor errors must
+        # propagate there to trigger the per-query retry in _fetch_risk_data
+        strict = tx is not None
+        
+        address_infos = self._get_address_info_batch(addresses, run)
+        known = [address for address in addresses if address_infos.get(address)]
+        layering_counts = self._get_layering_counts(known, run, strict) if known else {}
+        smurfing_data = self._get_smurfing_data(known, run, strict) if known else {}
+        rapid_sequences = self._get_rapid_sequence_counts(known, run, strict) if known else {}
+        return address_infos, layering_counts, smurfing_data, rapid_sequences
     
-    def _get_address_info(self, address: str) -> Optional[Dict[str, Any]]:
-        """Get comprehensive address information from Neo4j"""
+    def _get_address_info_batch(self, addresses: List[str], run: Callable[..., List[Any]]) -> Dict[str, Any]:
+        """Get address information for many addresses in a single query"""
         query = """
-        MATCH (a:Address {address: $address})
+        UNWIND $addresses AS addr
+        MATCH (a:Address {address: addr})
         OPTIONAL MATCH (a)-[:PARTICIPATED_IN]->(t:Transaction)
         WITH a, 
              count(t) as outgoing_tx_count,
@@ -116,9 +292,8 @@ class RiskScorer:
                last_incoming
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, address=address)
-            return result.single()
+        # Plain dicts: results are cached and deep-copied, which neo4j Records do not support
+        return {record['address']: record.data() for record in run(query, addresses=addresses)}
     
     def _calculate_volume_risk(self, address_info: Dict[str, Any]) -> float:
         """Calculate risk based on transaction volumes"""
@@ -131,27 +306,10 @@ class RiskScorer:
         
         # High volume relative to balance is risky
         if balance > 0:
-            volume_ratio = total_received / balance
-            if volume_ratio > 20:
-                return 0.95  # Very high risk
-            elif volume_ratio > 10:
-                return 0.85  # High risk
-            elif volume_ratio > 5:
-                return 0.7   # Medium-high risk
-            elif volume_ratio > 2:
-                return 0.5   # Medium risk
-            else:
-                return 0.3   # Low risk
+            return _band(total_received / balance, _VOLUME_RATIO_BANDS)
         
         # If no balance, consider absolute volumes
-        if total_received > 1000000000:  # 10 BTC
-            return 0.8
-        elif total_received > 100000000:  # 1 BTC
-            return 0.6
-        elif total_received > 10000000:   # 0.1 BTC
-            return 0.4
-        else:
-            return 0.2
+        return _band(total_received, _ABSOLUTE_VOLUME_BANDS)
     
     def _calculate_frequency_risk(self, address_info: Dict[str, Any]) -> float:
         """Calculate risk based on transaction frequency patterns"""
@@ -163,16 +321,7 @@ class RiskScorer:
         total_tx_count = address_info.get('transaction_count', 0) or 0
         
         # Very high transaction count is suspicious
-        if total_tx_count > 1000:
-            return 0.9
-        elif total_tx_count > 500:
-            return 0.8
-        elif total_tx_count > 100:
-            return 0.6
-        elif total_tx_count > 50:
-            return 0.4
-        else:
-            return 0.2
+        return _band(total_tx_count, _TX_COUNT_BANDS)
         
         # Consider ratio of incoming vs outgoing
         if outgoing_tx_count > 0 and incoming_tx_count > 0:
@@ -182,12 +331,13 @@ class RiskScorer:
         
         return risk_score
     
-    def _calculate_layering_risk(self, address: str) -> float:
-        """Calculate risk based on layering patterns"""
+    def _get_layering_counts(self, addresses: List[str], run: Callable[..., List[Any]],
+                             strict: bool = False) -> Optional[Dict[str, int]]:
+        """Count layering patterns per address; None if the query fails (raised when strict)"""
         try:
-            # Count layering patterns
             query = """
-            MATCH (a:Address {address: $address})-[:PARTICIPATED_IN]->(t1:Transaction),
+            UNWIND $addresses AS addr
+            MATCH (a:Address {address: addr})-[:PARTICIPATED_IN]->(t1:Transaction),
                   (intermediate:Address)-[:PARTICIPATED_IN]->(t1),
                   (intermediate)-[:PARTICIPATED_IN]->(t2:Transaction),
                   (final:Address)-[:PARTICIPATED_IN]->(t2)
@@ -195,107 +345,86 @@ class RiskScorer:
             AND t2.timestamp > datetime() - duration({hours: 24})
             AND intermediate <> final
             AND intermediate <> a
-            RETURN count(*) as layering_count
+            RETURN addr, count(*) as layering_count
             """
             
-            with self.driver.session() as session:
-                result = session.run(query, address=address)
-                layering_count = result.single()['layering_count'] or 0
-            
-            # Calculate risk based on layering count
-            if layering_count > 10:
-                return 0.95
-            elif layering_count > 5:
-                return 0.8
-            elif layering_count > 2:
-                return 0.6
-            elif layering_count > 0:
-                return 0.4
-            else:
-                return 0.1
+            return {record['addr']: record['layering_count'] or 0 for record in run(query, addresses=addresses)}
                 
         except Exception as e:
+            if strict:
+                raise
             logger.warning(f"Error calculating layering risk: {str(e)}")
-            return 0.3
+            return None
     
-    def _calculate_smurfing_risk(self, address: str) -> float:
-        """Calculate risk based on smurfing patterns"""
+    @staticmethod
+    def _layering_score(layering_count: int) -> float:
+        """Map a layering pattern count to a risk score"""
+        return _band(layering_count, _LAYERING_BANDS)
+    
+    def _get_smurfing_data(self, addresses: List[str], run: Callable[..., List[Any]],
+                           strict: bool = False) -> Optional[Dict[str, Any]]:
+        """Find rapid fan-out to many receivers per address; None if the query fails (raised when strict)"""
         try:
             # Count rapid transactions to multiple addresses
             query = """
-            MATCH (a:Address {address: $address})-[:PARTICIPATED_IN]->(t:Transaction),
+            UNWIND $addresses AS addr
+            MATCH (a:Address {address: addr})-[:PARTICIPATED_IN]->(t:Transaction),
                   (receiver:Address)-[:PARTICIPATED_IN]->(t)
             WHERE t.timestamp > datetime() - duration({hours: 1})
-            WITH a, count(t) as tx_count, count(DISTINCT receiver) as unique_receivers
+            WITH addr, count(t) as tx_count, count(DISTINCT receiver) as unique_receivers
             WHERE tx_count >= 5 AND unique_receivers >= tx_count * 0.8
-            RETURN tx_count, unique_receivers
+            RETURN addr, tx_count, unique_receivers
             """
             
-            with self.driver.session() as session:
-                result = session.run(query, address=address)
-                smurfing_data = result.single()
-            
-            if smurfing_data:
-                tx_count = smurfing_data['tx_count'] or 0
-                if tx_count > 20:
-                    return 0.9
-                elif tx_count > 10:
-                    return 0.7
-                elif tx_count >= 5:
-                    return 0.5
-            else:
-                return 0.1
+            return {record['addr']: record.data() for record in run(query, addresses=addresses)}
                 
         except Exception as e:
+            if strict:
+                raise
             logger.warning(f"Error calculating smurfing risk: {str(e)}")
-            return 0.3
+            return None
     
-    def _calculate_temporal_risk(self, address: str) -> float:
-        """Calculate risk based on temporal patterns"""
+    @staticmethod
+    def _smurfing_score(smurfing_data: Optional[Dict[str, Any]]) -> float:
+        """Map a smurfing query row (or None) to a risk score"""
+        if not smurfing_data:
+            return 0.1
+        return _band(smurfing_data['tx_count'] or 0, _SMURFING_BANDS)
+    
+    def _get_rapid_sequence_counts(self, addresses: List[str], run: Callable[..., List[Any]],
+                                   strict: bool = False) -> Optional[Dict[str, int]]:
+        """Count back-to-back transactions under a minute apart per address; None if the query fails (raised when strict)"""
         try:
             # Check for rapid transaction sequences
             query = """
-            MATCH (a:Address {address: $address})-[:PARTICIPATED_IN]->(t:Transaction)
+            UNWIND $addresses AS addr
+            MATCH (a:Address {address: addr})-[:PARTICIPATED_IN]->(t:Transaction)
             WHERE t.timestamp > datetime() - duration({hours: 24})
-            WITH a, t
+            WITH addr, t
             ORDER BY t.timestamp ASC
-            WITH a, collect(t) as transactions
+            WITH addr, collect(t) as transactions
             UNWIND range(0, size(transactions)-2) as i
-            WITH a, transactions[i] as tx1, transactions[i+1] as tx2
+            WITH addr, transactions[i] as tx1, transactions[i+1] as tx2
             WHERE duration({milliseconds: tx2.timestamp - tx1.timestamp}).minutes < 1
-            RETURN count(*) as rapid_sequences
+            RETURN addr, count(*) as rapid_sequences
             """
             
-            with self.driver.session() as session:
-                result = session.run(query, address=address)
-                rapid_sequences = result.single()['rapid_sequences'] or 0
-            
-            # Calculate risk based on rapid sequences
-            if rapid_sequences > 10:
-                return 0.8
-            elif rapid_sequences > 5:
-                return 0.6
-            elif rapid_sequences > 0:
-                return 0.4
-            else:
-                return 0.1
+            return {record['addr']: record['rapid_sequences'] or 0 for record in run(query, addresses=addresses)}
                 
         except Exception as e:
+            if strict:
+                raise
             logger.warning(f"Error calculating temporal risk: {str(e)}")
-            return 0.3
+            return None
+    
+    @staticmethod
+    def _temporal_score(rapid_sequences: int) -> float:
+        """Map a rapid sequence count to a risk score"""
+        return _band(rapid_sequences, _TEMPORAL_BANDS)
     
     def _classify_risk_level(self, score: float) -> str:
         """Classify risk score into levels"""
-        if score >= 0.8:
-            return "CRITICAL"
-        elif score >= 0.6:
-            return "HIGH"
-        elif score >= 0.4:
-            return "MEDIUM"
-        elif score >= 0.2:
-            return "LOW"
-        else:
-            return "VERY_LOW"
+        return _LEVEL_LABELS[bisect_right(_LEVEL_THRESHOLDS, score)]
     
     def _get_default_risk_score(self, address: str) -> Dict[str, Any]:
         """Return default risk score when calculation fails"""
@@ -311,23 +440,15 @@ class RiskScorer:
     
     def get_risk_summary(self, addresses: List[str]) -> Dict[str, Any]:
         """Get risk summary for multiple addresses"""
-        risk_scores = []
-        risk_distribution = {
-            'CRITICAL': 0,
-            'HIGH': 0,
-            'MEDIUM': 0,
-            'LOW': 0,
-            'VERY_LOW': 0
-        }
-        
-        for address in addresses:
-            risk_score = self.calculate_address_risk_score(address)
-            risk_scores.append(risk_score)
-            risk_distribution[risk_score['risk_level']] += 1
+        scores_by_address = self._score_addresses(list(dict.fromkeys(addresses)))
+        risk_scores = [scores_by_address[address] for address in addresses]
         
         # Calculate aggregate statistics
-        total_scores = [rs['total_risk_score'] for rs in risk_scores]
-        avg_risk = sum(total_scores) / len(total_scores) if total_scores else 0
+        level_counts = Counter(rs['risk_level'] for rs in risk_scores)
+        risk_distribution = {level: level_counts.get(level, 0) for level in RISK_LEVELS}
+        scores = np.fromiter((rs['total_risk_score'] for rs in risk_scores),
+                             dtype=np.float64, count=len(risk_scores))
+        avg_risk = float(scores.mean()) if scores.size else 0
         
         return {
             'total_addresses': len(addresses),
@@ -340,42 +461,41 @@ class RiskScorer:
     def export_risk_report(self, addresses: List[str], output_file: str = None) -> str:
         """Export risk analysis report to file"""
         risk_summary = self.get_risk_summary(addresses)
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        report_lines = [
-            "ChainBreak Risk Analysis Report",
-            "=" * 50,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Total Addresses Analyzed: {risk_summary['total_addresses']}",
-            f"Average Risk Score: {risk_summary['average_risk_score']:.3f}",
-            "",
-            "Risk Level Distribution:",
-            "-" * 25
-        ]
+        if output_file:
+            try:
+                # Stream the report straight into the file buffer
+                with open(output_file, 'w', buffering=1 << 20) as f:
+                    f.writelines(self._iter_report_lines(risk_summary, generated))
+                logger.info(f"Risk report exported to {output_file}")
+            except Exception as e:
+                logger.error(f"Error exporting report: {str(e)}")
+        
+        return "".join(self._iter_report_lines(risk_summary, generated))
+    
+    @staticmethod
+    def _iter_report_lines(risk_summary: Dict[str, Any], generated: str) -> Iterator[str]:
+        """Yield the report text in pieces (newline-separated, no trailing newline)"""
+        yield "ChainBreak Risk Analysis Report\n"
+        yield "=" * 50 + "\n"
+        yield f"Generated: {generated}\n"
+        yield f"Total Addresses Analyzed: {risk_summary['total_addresses']}\n"
+        yield f"Average Risk Score: {risk_summary['average_risk_score']:.3f}\n"
+        yield "\n"
+        yield "Risk Level Distribution:\n"
+        yield "-" * 25 + "\n"
         
         for level, count in risk_summary['risk_distribution'].items():
-            report_lines.append(f"{level}: {count}")
+            yield f"{level}: {count}\n"
         
-        report_lines.extend([
-            "",
-            "High Risk Addresses:",
-            "-" * 25
-        ])
+        yield "\n"
+        yield "High Risk Addresses:\n"
+        yield "-" * 25
         
         for high_risk in risk_summary['high_risk_addresses']:
-            report_lines.append(
-                f"Address: {high_risk['address']} | "
+            yield (
+                f"\nAddress: {high_risk['address']} | "
                 f"Risk Score: {high_risk['total_risk_score']:.3f} | "
                 f"Level: {high_risk['risk_level']}"
             )
-        
-        report_content = "\n".join(report_lines)
-        
-        if output_file:
-            try:
-                with open(output_file, 'w') as f:
-                    f.write(report_content)
-                logger.info(f"Risk report exported to {output_file}")
-            except Exception as e:
-                logger.error(f"Error exporting report: {str(e)}")
-        
-        return report_content
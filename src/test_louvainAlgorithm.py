@@ -7,6 +7,7 @@ and can be used as a reference for backend integration.
 import json
 import os
 import networkx as nx
+import numpy as np
 import community.community_louvain as community_louvain
 import matplotlib.pyplot as plt
 from pathlib import Path
@@ -133,23 +134,24 @@ def visualize_communities(results, save_path=None):
     G = results['graph']
     partition = results['partition']
     
-    # Create layout
-    pos = nx.spring_layout(G, k=0.5, iterations=50)
+    # Create layout (fixed seed so repeated runs give the same picture)
+    pos = nx.spring_layout(G, k=0.5, iterations=50, seed=42)
     
     # Create color map
     num_communities = results['num_communities']
-    cmap = plt.cm.get_cmap('tab10' if num_communities <= 10 else 'viridis', num_communities)
+    cmap = plt.get_cmap('tab10' if num_communities <= 10 else 'viridis', num_communities)
     
     # Create figure
     plt.figure(figsize=(14, 10))
     
-    # Draw nodes colored by community
-    node_colors = [partition[node] for node in G.nodes()]
+    # Draw nodes colored by community; community ids index the colormap's
+    # lookup table directly, giving one (N, 4) RGBA array in a single call
+    community_ids = np.fromiter((partition[node] for node in G.nodes()),
+                                dtype=np.int64, count=G.number_of_nodes())
     nx.draw_networkx_nodes(
         G, pos,
-        node_color=node_colors,
+        node_color=cmap(community_ids),
         node_size=500,
-        cmap=cmap,
         alpha=0.9
     )
     
@@ -4,12 +4,34 @@ Run this after starting the Flask server to test the /api/louvain endpoint
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # API endpoint
 API_URL = "http://localhost:5001/api/louvain"
 
+# Shared across calls so a looped harness reuses the pooled keep-alive connection
+_session = None
+
+
+def _get_session(pool_connections=10, pool_maxsize=100):
+    """Return the module's requests session, creating it on first use"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+    return _session
+
+
 def test_louvain_endpoint():
     """Test the Louvain API endpoint with sample graph data"""
     
@@ -38,17 +60,25 @@ def test_louvain_endpoint():
     
     try:
         print(f"Sending POST request to {API_URL}...")
-        response = requests.post(
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(request_data)
+        else:
+            body = json.dumps(request_data)
+        response = _get_session().post(
             API_URL,
-            json=request_data,
-            headers={"Content-Type": "application/json"}
+            data=body,
+            headers={"Content-Type": "application/json"},
+            stream=False
         )
         
         print(f"Status Code: {response.status_code}")
         print()
         
         if response.status_code == 200:
-            result = response.json()
+            if ORJSON_AVAILABLE:
+                result = orjson.loads(response.content)
+            else:
+                result = response.json()
             
             if result.get("success"):
                 data = result["data"]
@@ -6,10 +6,28 @@ and can be used as a reference for backend integration.
 
 import json
 import os
+import numpy as np
 import networkx as nx
 import community.community_louvain as community_louvain
 from pathlib import Path
 
+try:
+    import networkit as nk
+    NETWORKIT_AVAILABLE = True
+except ImportError:
+    NETWORKIT_AVAILABLE = False
+
+try:
+    import igraph as ig
+    IGRAPH_AVAILABLE = True
+except ImportError:
+    IGRAPH_AVAILABLE = False
+
+# Below this size the NetworkX build is cheap and python-louvain's results
+# are kept as the reference; above it a compiled backend (networkit C++ or
+# igraph C) is used when one is installed
+FAST_LOUVAIN_MIN_EDGES = 10000
+
 
 def load_graph_from_json(file_path):
     """
@@ -25,7 +43,7 @@ def load_graph_from_json(file_path):
         return json.load(f)
 
 
-def run_louvain_algorithm(graph_data, resolution=1.0, weight_attribute='weight'):
+def run_louvain_algorithm(graph_data, resolution=1.0, weight_attribute='weight', engine='networkx'):
     """
     Run Louvain community detection algorithm on graph data.
     
@@ -33,6 +51,9 @@ def run_louvain_algorithm(graph_data, resolution=1.0, weight_attribute='weight')
         graph_data (dict): Dictionary containing 'nodes' and 'edges' lists
         resolution (float): Resolution parameter (1.0 = standard, >1.0 = smaller communities)
         weight_attribute (str): Edge attribute to use as weight
+        engine (str): 'networkx' for python-louvain, or 'igraph' to run the
+            search in igraph's C multilevel implementation (falls back to
+            python-louvain when igraph is not installed)
         
     Returns:
         dict: Results containing:
@@ -40,28 +61,27 @@ def run_louvain_algorithm(graph_data, resolution=1.0, weight_attribute='weight')
             - communities: {community_id: [node_ids]}
             - modularity: Quality metric of the partition
             - num_communities: Total number of communities found
-            - graph: NetworkX graph object
+            - graph: NetworkX graph object (omitted with engine='igraph',
+              which never builds one; use _build_nx_graph if needed)
     """
-    # Build NetworkX graph (undirected for Louvain)
-    G = nx.Graph()
+    if engine not in ('networkx', 'igraph'):
+        raise ValueError(f"Unknown Louvain engine: {engine}")
     
-    # Add nodes with attributes
-    for node in graph_data.get('nodes', []):
-        G.add_node(
-            node['id'],
-            label=node.get('label', node['id']),
-            node_type=node.get('type', 'unknown')
-        )
-    
-    # Add edges with weights
-    for edge in graph_data.get('edges', []):
-        # Use 'value' or 'weight' from edge data
-        weight = edge.get('value', edge.get('weight', 1))
-        G.add_edge(
-            edge['source'],
-            edge['target'],
-            weight=weight
-        )
+    if engine == 'igraph' and IGRAPH_AVAILABLE:
+        # Edge weights come from 'value'/'weight' exactly as for the NetworkX graph
+        node_ids, lo, hi, weights = _edge_arrays(graph_data)
+        membership, modularity = _louvain_igraph(len(node_ids), lo, hi, weights, resolution)
+        _, membership = np.unique(membership, return_inverse=True)
+        
+        communities = _group_by_community(node_ids, membership)
+        return {
+            'partition': dict(zip(node_ids, membership.tolist())),
+            'communities': communities,
+            'modularity': modularity,
+            'num_communities': len(communities)
+        }
+    
+    G = _build_nx_graph(graph_data)
     
     # Apply Louvain algorithm
     partition = community_louvain.best_partition(G, weight=weight_attribute, resolution=resolution)
@@ -70,11 +90,10 @@ def run_louvain_algorithm(graph_data, resolution=1.0, weight_attribute='weight')
     modularity = community_louvain.modularity(partition, G, weight=weight_attribute)
     
     # Organize nodes by community
-    communities = {}
-    for node_id, comm_id in partition.items():
-        if comm_id not in communities:
-            communities[comm_id] = []
-        communities[comm_id].append(node_id)
+    communities = _group_by_community(
+        list(partition.keys()),
+        np.fromiter(partition.values(), dtype=np.int64, count=len(partition))
+    )
     
     return {
         'partition': partition,
@@ -85,6 +104,156 @@ def run_louvain_algorithm(graph_data, resolution=1.0, weight_attribute='weight')
     }
 
 
+def _build_nx_graph(graph_data):
+    """Build the undirected NetworkX graph with node labels/types and edge weights"""
+    G = nx.Graph()
+    
+    # Add nodes with attributes
+    G.add_nodes_from(
+        (node['id'], {'label': node.get('label', node['id']),
+                      'node_type': node.get('type', 'unknown')})
+        for node in graph_data.get('nodes', [])
+    )
+    
+    # Add edges with weights ('value' or 'weight' from edge data)
+    G.add_edges_from(
+        (edge['source'], edge['target'],
+         {'weight': edge.get('value', edge.get('weight', 1))})
+        for edge in graph_data.get('edges', [])
+    )
+    return G
+
+
+def _group_by_community(node_ids, membership):
+    """
+    Bucket node ids by community id without a per-node Python loop.
+    
+    A stable argsort keeps each community's members in their original order,
+    and communities are emitted in order of first appearance.
+    
+    Args:
+        node_ids (list): Node ids, aligned with membership
+        membership (np.ndarray): Integer community id per node
+        
+    Returns:
+        dict: {community_id: [node_ids]}
+    """
+    if len(node_ids) == 0:
+        return {}
+    
+    order = np.argsort(membership, kind='stable')
+    sorted_nodes = np.array(node_ids, dtype=object)[order]
+    comm_ids, starts = np.unique(membership[order], return_index=True)
+    groups = np.split(sorted_nodes, starts[1:])
+    return {
+        int(comm_ids[i]): groups[i].tolist()
+        for i in np.argsort(order[starts], kind='stable')
+    }
+
+
+def _edge_arrays(graph_data):
+    """
+    Map node ids to contiguous indices and build the undirected edge list.
+    
+    Edges may reference nodes not listed in 'nodes' (NetworkX adds those
+    implicitly), and repeated edges keep the last weight, matching
+    run_louvain_algorithm's nx.Graph construction.
+    
+    Returns:
+        tuple: (node_ids, lo, hi, weights) with lo/hi int64 index arrays
+    """
+    edges = graph_data.get('edges', [])
+    index = {}
+    for node in graph_data.get('nodes', []):
+        index.setdefault(node['id'], len(index))
+    for edge in edges:
+        index.setdefault(edge['source'], len(index))
+        index.setdefault(edge['target'], len(index))
+    node_ids = list(index)
+    n = len(node_ids)
+    
+    src = np.fromiter((index[e['source']] for e in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((index[e['target']] for e in edges), dtype=np.int64, count=len(edges))
+    weights = np.fromiter((e.get('value', e.get('weight', 1)) for e in edges),
+                          dtype=np.float64, count=len(edges))
+    
+    # Undirected, last duplicate wins (same as repeated nx.Graph.add_edge)
+    lo = np.minimum(src, dst)
+    hi = np.maximum(src, dst)
+    _, first_from_end = np.unique((lo * n + hi)[::-1], return_index=True)
+    keep = len(edges) - 1 - first_from_end
+    
+    return node_ids, lo[keep], hi[keep], weights[keep]
+
+
+def _louvain_networkit(n, lo, hi, weights, resolution):
+    """Run networkit's parallel Louvain (PLM); returns (membership, modularity)"""
+    G = nk.Graph(n, weighted=True, directed=False)
+    G.addEdges((weights, (lo, hi)))
+    
+    plm = nk.community.PLM(G, refine=True, gamma=resolution)
+    plm.run()
+    communities_found = plm.getPartition()
+    modularity = nk.community.Modularity().getQuality(communities_found, G)
+    return np.asarray(communities_found.getVector()), modularity
+
+
+def _louvain_igraph(n, lo, hi, weights, resolution):
+    """Run igraph's multilevel (Louvain) method; returns (membership, modularity)"""
+    G = ig.Graph(n=n, edges=np.column_stack((lo, hi)).tolist())
+    G.es['weight'] = weights.tolist()
+    
+    clustering = G.community_multilevel(weights='weight', resolution=resolution)
+    modularity = G.modularity(clustering.membership, weights='weight')
+    return np.asarray(clustering.membership), modularity
+
+
+def run_louvain_fast(graph_data, resolution=1.0):
+    """
+    Run Louvain community detection, using a compiled backend for large graphs.
+    
+    Node ids are mapped to integer indices once and the edge list is built as
+    NumPy arrays, so no per-edge NetworkX graph construction is needed; the
+    community search itself runs in networkit's C++ PLM implementation, or
+    igraph's C multilevel implementation when networkit is missing. Falls
+    back to run_louvain_algorithm when neither is installed or the graph is
+    small.
+    
+    Args:
+        graph_data (dict): Dictionary containing 'nodes' and 'edges' lists
+        resolution (float): Resolution parameter (1.0 = standard, >1.0 = smaller communities)
+        
+    Returns:
+        dict: Same keys as run_louvain_algorithm; 'graph' is only present
+            when the small-graph fallback to run_louvain_algorithm is taken
+    """
+    if NETWORKIT_AVAILABLE:
+        backend = _louvain_networkit
+    elif IGRAPH_AVAILABLE:
+        backend = _louvain_igraph
+    else:
+        backend = None
+    
+    if backend is None or len(graph_data.get('edges', [])) < FAST_LOUVAIN_MIN_EDGES:
+        return run_louvain_algorithm(graph_data, resolution=resolution)
+    
+    node_ids, lo, hi, weights = _edge_arrays(graph_data)
+    membership, modularity = backend(len(node_ids), lo, hi, weights, resolution)
+    
+    # Renumber community ids densely from 0, as python-louvain does
+    _, membership = np.unique(membership, return_inverse=True)
+    
+    partition = dict(zip(node_ids, membership.tolist()))
+    communities = _group_by_community(node_ids, membership)
+    
+    return {
+        'partition': partition,
+        'communities': communities,
+        'modularity': modularity,
+        'num_communities': len(communities)
+    }
+
+
 def print_community_results(results):
     """
     Print community detection results in a readable format.
@@ -101,15 +270,17 @@ def print_community_results(results):
     print("=" * 60)
     print()
     
-    G = results['graph']
+    # Results from the compiled engines carry no graph; show bare ids then
+    G = results.get('graph')
     
     for comm_id, members in sorted(results['communities'].items()):
         print(f"┌─ Community {comm_id} ({len(members)} nodes)")
         print("│")
         
         for member in members:
-            node_type = G.nodes[member].get('node_type', 'unknown')
-            label = G.nodes[member].get('label', member[:15])
+            attrs = G.nodes[member] if G is not None else {}
+            node_type = attrs.get('node_type', 'unknown')
+            label = attrs.get('label', member[:15])
             
             # Truncate long labels
             if len(label) > 15:
@@ -4,10 +4,19 @@ Batch processing and performance optimization utilities
 """
 
 import logging
+import functools
+import json
 from typing import List, Dict, Any, Optional, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 from datetime import datetime, timedelta
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -248,25 +257,122 @@ class CacheManager:
         }
 
 
+def _to_plain(value: Any) -> Any:
+    """Convert neo4j Records (tuple subclasses that serialize as lists) to dicts, recursively"""
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, tuple) and hasattr(value, 'items'):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_plain(item) for item in value)
+    return value
+
+
+class AnalysisResultCache:
+    """Redis read-through cache for address analysis results.
+
+    Redis is optional: if the client library is missing or the server is
+    unreachable the cache disables itself and every lookup is a miss.
+    Results are stored as JSON; datetimes and other non-JSON values come
+    back as strings.
+    """
+
+    KEY_VERSION = "v3"
+
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", ttl_seconds: int = 3600):
+        self.ttl_seconds = ttl_seconds
+        self.client = None
+
+        try:
+            import redis
+            client = redis.Redis.from_url(
+                redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+            client.ping()
+            self.client = client
+            logger.info(f"Analysis result cache connected to {redis_url}")
+        except Exception as e:
+            logger.info(f"Analysis result cache disabled: {str(e)}")
+
+    def is_available(self) -> bool:
+        """Check if the Redis backend is usable"""
+        return self.client is not None
+
+    def _key(self, address: str, blockchain: str) -> str:
+        return f"cb:{self.KEY_VERSION}:{blockchain}:{address}"
+
+    def get(self, address: str, blockchain: str = 'btc') -> Optional[Dict[str, Any]]:
+        """Get cached analysis results"""
+        if not self.client:
+            return None
+        try:
+            cached = self.client.get(self._key(address, blockchain))
+            if cached is None:
+                return None
+            return orjson.loads(cached) if ORJSON_AVAILABLE else json.loads(cached)
+        except Exception as e:
+            logger.warning(f"Error reading analysis cache: {str(e)}")
+            return None
+
+    def set(self, address: str, blockchain: str, results: Dict[str, Any]):
+        """Cache analysis results"""
+        if not self.client:
+            return
+        try:
+            plain = _to_plain(results)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(plain, default=str, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(plain, default=str)
+            self.client.setex(self._key(address, blockchain), self.ttl_seconds, payload)
+        except Exception as e:
+            logger.warning(f"Error writing analysis cache: {str(e)}")
+
+    def invalidate(self, address: str, blockchain: str = 'btc'):
+        """Drop cached results, e.g. after new data for the address is ingested"""
+        if not self.client:
+            return
+        try:
+            self.client.delete(self._key(address, blockchain))
+        except Exception as e:
+            logger.warning(f"Error invalidating analysis cache: {str(e)}")
+
+
 class DataValidator:
     """Validates data integrity and format"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def validate_bitcoin_address(address: str) -> bool:
-        """Validate Bitcoin address format"""
+        """Validate Bitcoin address format (memoized for repeat addresses)"""
         if not address:
             return False
 
-        # Basic Bitcoin address validation
-        if len(address) < 26 or len(address) > 35:
-            return False
+        # Basic Bitcoin address validation: bech32 (bc1) addresses are 42
+        # (P2WPKH) to 62 (P2WSH, P2TR) characters, base58 ones 26 to 35
+        if address.startswith('bc1'):
+            return 42 <= len(address) <= 62
 
-        # Check if starts with common prefixes
-        valid_prefixes = ['1', '3', 'bc1']
-        if not any(address.startswith(prefix) for prefix in valid_prefixes):
+        if not address.startswith(('1', '3')):
             return False
 
-        return True
+        return 26 <= len(address) <= 35
+
+    @staticmethod
+    def validate_bitcoin_addresses(addresses: List[str]) -> np.ndarray:
+        """Validate a batch of Bitcoin addresses, returning a boolean mask.
+
+        Applies the same length/prefix rules as validate_bitcoin_address,
+        but as vectorized NumPy string operations over the whole batch.
+        """
+        if not addresses:
+            return np.zeros(0, dtype=bool)
+
+        arr = np.asarray([a if isinstance(a, str) else '' for a in addresses], dtype=str)
+        lengths = np.char.str_len(arr)
+        base58 = np.char.startswith(arr, '1') | np.char.startswith(arr, '3')
+        bech32 = np.char.startswith(arr, 'bc1')
+        return ((base58 & (lengths >= 26) & (lengths <= 35)) |
+                (bech32 & (lengths >= 42) & (lengths <= 62)))
 
     @staticmethod
     def validate_transaction_hash(tx_hash: str) -> bool:
@@ -305,6 +411,9 @@ class DataValidator:
     @staticmethod
     def validate_numeric_value(value, min_value: float = 0) -> bool:
         """Validate numeric value"""
+        # Ints and floats (what JSON decoding yields) skip the float() round-trip
+        if type(value) is int or type(value) is float:
+            return value >= min_value
         try:
             num_value = float(value)
             return num_value >= min_value
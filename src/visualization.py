@@ -7,8 +7,11 @@ import matplotlib.pyplot as plt
 import networkx as nx
 from neo4j import GraphDatabase
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Tuple
 import os
+import shutil
+import tempfile
+from xml.sax.saxutils import quoteattr
 
 logger = logging.getLogger(__name__)
 
@@ -290,6 +293,24 @@ class NetworkVisualizer:
 class GephiExporter:
     """Exports transaction networks to Gephi format"""
     
+    # Records are pulled from Neo4j in batches of this size while streaming
+    FETCH_SIZE = 10000
+    
+    GEXF_HEADER = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n'
+        '  <graph defaultedgetype="directed" mode="static">\n'
+        '    <attributes class="node">\n'
+        '      <attribute id="0" title="type" type="string"/>\n'
+        '    </attributes>\n'
+        '    <attributes class="edge">\n'
+        '      <attribute id="0" title="value" type="double"/>\n'
+        '      <attribute id="1" title="type" type="string"/>\n'
+        '      <attribute id="2" title="timestamp" type="string"/>\n'
+        '    </attributes>\n'
+    )
+    GEXF_FOOTER = '  </graph>\n</gexf>\n'
+    
     def __init__(self, neo4j_driver):
         self.driver = neo4j_driver
         
@@ -307,29 +328,11 @@ class GephiExporter:
             LIMIT $max_transactions
             """
             
-            with self.driver.session() as session:
+            with self.driver.session(fetch_size=self.FETCH_SIZE) as session:
                 result = session.run(query, max_transactions=max_transactions)
-                
-            # Build NetworkX graph
-            G = nx.DiGraph()
+                node_count, edge_count = self._stream_gexf(result, output_file)
             
-            for record in result:
-                source = record['source']
-                target = record['target']
-                value = record['value']
-                timestamp = record['timestamp']
-                tx_hash = record['tx_hash']
-                
-                G.add_node(source, type='Address', label=source)
-                G.add_node(target, type='Address', label=target)
-                G.add_node(tx_hash, type='Transaction', label=tx_hash[:8] + '...')
-                
-                G.add_edge(source, tx_hash, type='PARTICIPATED_IN', value=value, timestamp=timestamp)
-                G.add_edge(tx_hash, target, type='PARTICIPATED_IN', value=value, timestamp=timestamp)
-            
-            # Export to GEXF format for Gephi
-            nx.write_gexf(G, output_file)
-            logger.info(f"Network exported to {output_file} with {len(G.nodes())} nodes and {len(G.edges())} edges")
+            logger.info(f"Network exported to {output_file} with {node_count} nodes and {edge_count} edges")
             
             return output_file
             
@@ -338,30 +341,133 @@ class GephiExporter:
             return ""
     
     def export_address_subgraph(self, address: str, depth: int = 2, 
-                               output_file: str = None) -> str:
-        """Export a specific address subgraph to Gephi"""
+                               output_file: str = None, max_nodes: int = 1000) -> str:
+        """Export a specific address subgraph to Gephi.
+        
+        Transactions of every address within depth - 1 address->transaction->
+        address hops of the given address are exported (depth=1 is its own
+        transactions only), stopping once max_nodes distinct nodes are written.
+        """
         try:
             if not output_file:
                 output_file = f"subgraph_{address[:8]}_{depth}.gexf"
             
             logger.info(f"Exporting subgraph for {address} to {output_file}")
             
-            # Build the subgraph
-            visualizer = NetworkVisualizer(self.driver)
-            G = visualizer._build_network_graph(address, depth, 1000)
+            # Variable-length bounds cannot be query parameters; each hop to a
+            # neighbouring address is two PARTICIPATED_IN relationships
+            hops = 2 * max(int(depth) - 1, 0)
+            query = f"""
+            MATCH (a:Address {{address: $address}})-[:PARTICIPATED_IN*0..{hops}]-(src:Address)
+            WITH DISTINCT src
+            MATCH (src)-[:PARTICIPATED_IN]->(t:Transaction),
+                  (receiver:Address)-[:PARTICIPATED_IN]->(t)
+            RETURN src.address as source, receiver.address as target, t.tx_hash as tx_hash, t.value as value
+            """
             
-            if len(G.nodes()) == 0:
+            with self.driver.session(fetch_size=self.FETCH_SIZE) as session:
+                result = session.run(query, address=address)
+                node_count, edge_count = self._stream_gexf(result, output_file, max_nodes)
+            
+            if node_count == 0:
                 logger.warning(f"No data found for address {address}")
+                os.remove(output_file)
                 return ""
             
-            # Export to GEXF
-            nx.write_gexf(G, output_file)
-            logger.info(f"Subgraph exported to {output_file}")
+            logger.info(f"Subgraph exported to {output_file} with {node_count} nodes and {edge_count} edges")
             
             return output_file
             
         except Exception as e:
             logger.error(f"Error exporting subgraph: {str(e)}")
+            return ""
+    
+    def _stream_gexf(self, records: Iterable, output_file: str,
+                     max_nodes: Optional[int] = None) -> Tuple[int, int]:
+        """Write source -> transaction -> target records to GEXF incrementally.
+        
+        Nodes are written straight to the output file as they are first seen;
+        edges are spooled to a temporary file and appended after the node
+        section, so memory stays bounded by the fetch batch plus the seen-id
+        sets rather than the full graph. The document is written to a temporary
+        file next to output_file and moved into place only once complete, so
+        a driver error mid-stream never leaves a truncated .gexf behind.
+        Reading stops at the first record that would take the node count past
+        max_nodes.
+        """
+        tmp_path = f"{output_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as out:
+                node_count, edge_count = self._write_gexf(records, out, max_nodes)
+            os.replace(tmp_path, output_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        
+        return node_count, edge_count
+    
+    def _write_gexf(self, records: Iterable, out,
+                    max_nodes: Optional[int] = None) -> Tuple[int, int]:
+        """Write the GEXF document for the records to an open text file"""
+        seen_nodes = set()
+        seen_edges = set()
+        
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as edges:
+            out.write(self.GEXF_HEADER)
+            out.write('    <nodes>\n')
+            
+            for record in records:
+                source = record['source']
+                target = record['target']
+                tx_hash = record['tx_hash']
+                value = record['value']
+                timestamp = record.get('timestamp')
+                
+                record_nodes = ((source, 'Address', source),
+                                (target, 'Address', target),
+                                (tx_hash, 'Transaction', tx_hash[:8] + '...'))
+                if max_nodes is not None:
+                    new_ids = {node_id for node_id, _, _ in record_nodes} - seen_nodes
+                    if len(seen_nodes) + len(new_ids) > max_nodes:
+                        break
+                
+                for node_id, node_type, label in record_nodes:
+                    if node_id not in seen_nodes:
+                        seen_nodes.add(node_id)
+                        out.write(self._gexf_node(node_id, node_type, label))
+                
+                for edge_key in ((source, tx_hash), (tx_hash, target)):
+                    if edge_key not in seen_edges:
+                        seen_edges.add(edge_key)
+                        edges.write(self._gexf_edge(len(seen_edges) - 1, *edge_key, value, timestamp))
+            
+            out.write('    </nodes>\n')
+            out.write('    <edges>\n')
+            edges.seek(0)
+            shutil.copyfileobj(edges, out)
+            out.write('    </edges>\n')
+            out.write(self.GEXF_FOOTER)
+        
+        return len(seen_nodes), len(seen_edges)
+    
+    @staticmethod
+    def _gexf_node(node_id: str, node_type: str, label: str) -> str:
+        """Format a single GEXF node element"""
+        return (f'      <node id={quoteattr(str(node_id))} label={quoteattr(str(label))}>'
+                f'<attvalues><attvalue for="0" value={quoteattr(node_type)}/></attvalues></node>\n')
+    
+    @staticmethod
+    def _gexf_edge(edge_id: int, source: str, target: str, value, timestamp=None) -> str:
+        """Format a single GEXF edge element"""
+        attvalues = '<attvalue for="1" value="PARTICIPATED_IN"/>'
+        if value is not None:
+            attvalues = f'<attvalue for="0" value="{float(value)}"/>' + attvalues
+        if timestamp is not None:
+            attvalues += f'<attvalue for="2" value={quoteattr(str(timestamp))}/>'
+        return (f'      <edge id="{edge_id}" source={quoteattr(str(source))} '
+                f'target={quoteattr(str(target))} label="PARTICIPATED_IN">'
+                f'<attvalues>{attvalues}</attvalues></edge>\n')
 
 
 class ChartGenerator:
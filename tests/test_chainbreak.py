@@ -44,6 +44,40 @@ class TestDataValidator(unittest.TestCase):
                 self.assertFalse(
                     DataValidator.validate_bitcoin_address(address))
 
+    def test_validate_bitcoin_address_cached(self):
+        """Test repeated address validation is served from the cache"""
+        address = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+        DataValidator.validate_bitcoin_address(address)
+        hits = DataValidator.validate_bitcoin_address.cache_info().hits
+
+        self.assertTrue(DataValidator.validate_bitcoin_address(address))
+        self.assertEqual(
+            DataValidator.validate_bitcoin_address.cache_info().hits, hits + 1)
+
+    def test_validate_bitcoin_addresses_batch(self):
+        """Test batch validation matches per-address validation"""
+        addresses = [
+            "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+            "3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy",
+            "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4",
+            "bc1p5d7rjq7g6rdk2yhzks9smlaqtedr4dekq08ge8ztwac72sfr9rusxg3297",
+            "bc1qshort",
+            "",
+            "invalid",
+            "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa123456789",
+            "1234567890123456789012345678901234567890",
+            None,
+        ]
+
+        mask = DataValidator.validate_bitcoin_addresses(addresses)
+
+        self.assertEqual(mask.tolist(), [
+            bool(address) and DataValidator.validate_bitcoin_address(address)
+            for address in addresses
+        ])
+        self.assertEqual(
+            len(DataValidator.validate_bitcoin_addresses([])), 0)
+
     def test_validate_transaction_hash(self):
         """Test transaction hash validation"""
         # Valid transaction hash
@@ -217,6 +251,57 @@ class TestChainBreakIntegration(unittest.TestCase):
             self.skipTest(f"Neo4j not available: {str(e)}")
 
 
+class TestBatchAnalysis(unittest.TestCase):
+    """Test concurrent multi-address analysis"""
+
+    def test_duplicates_analyzed_once(self):
+        """Test repeated addresses are analyzed once and counted once"""
+        chainbreak = ChainBreak.__new__(ChainBreak)
+        chainbreak.backend_mode = "json"
+        calls = []
+        a = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+        b = "3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy"
+        bad = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+
+        def analyze_address(address, blockchain='btc', generate_visualizations=True):
+            calls.append(address)
+            if address == bad:
+                return {'error': 'Data ingestion failed'}
+            return {'address': address}
+
+        chainbreak.analyze_address = analyze_address
+        results = chainbreak.analyze_multiple_addresses([a, b, a, bad, b])
+
+        self.assertEqual(sorted(calls), sorted([a, b, bad]))
+        self.assertEqual(results['addresses_analyzed'], 3)
+        self.assertEqual(results['duplicates_skipped'], 2)
+        self.assertEqual(results['successful_analyses'], 2)
+        self.assertEqual(results['failed_analyses'], 1)
+        self.assertEqual(list(results['results']), [a, b, bad])
+
+    def test_invalid_addresses_not_analyzed(self):
+        """Test addresses failing validation are reported without analysis"""
+        chainbreak = ChainBreak.__new__(ChainBreak)
+        chainbreak.backend_mode = "json"
+        calls = []
+        a = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+        segwit = "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4"
+
+        def analyze_address(address, blockchain='btc', generate_visualizations=True):
+            calls.append(address)
+            return {'address': address}
+
+        chainbreak.analyze_address = analyze_address
+        results = chainbreak.analyze_multiple_addresses(["not-an-address", a, segwit])
+
+        self.assertEqual(sorted(calls), sorted([a, segwit]))
+        self.assertEqual(results['failed_analyses'], 1)
+        self.assertEqual(results['results']["not-an-address"],
+                         {'error': 'Invalid Bitcoin address'})
+        self.assertEqual(results['results'][segwit], {'address': segwit})
+        self.assertEqual(list(results['results']), ["not-an-address", a, segwit])
+
+
 class TestConfiguration(unittest.TestCase):
     """Test configuration management"""
 
@@ -261,6 +346,7 @@ def run_tests():
         TestPerformanceMonitor,
         TestBatchProcessor,
         TestChainBreakIntegration,
+        TestBatchAnalysis,
         TestConfiguration
     ]
 
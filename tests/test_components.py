@@ -0,0 +1,669 @@
+"""
+Unit Tests for ChainBreak components
+Tests components without external services (blockchain.info, Neo4j)
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import networkx as nx
+from neo4j import Record
+
+from src.api import IJSON_AVAILABLE, STREAMING_JSON_MIN_BYTES
+from src.fetch_blockchain_com import BlockchainComFetcher, FetcherConfig
+from src.graph_build import add_transactions
+from src.risk_scoring import RiskScorer
+from src.visualization import GephiExporter
+
+ADDR_A = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
+ADDR_B = "3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy"
+ADDR_C = "1BoatSLRHtKNngkdXEeobR76b53LETtpyT"
+TX_1 = "a" * 64
+TX_2 = "b" * 64
+
+# rawaddr responses keyed by address
+ADDRESS_DATA = {
+    ADDR_A: {"txs": [
+        {"hash": TX_1,
+         "inputs": [{"prev_out": {"addr": ADDR_B, "value": 5}}],
+         "out": [{"addr": ADDR_A, "value": 4}, {"addr": None}]}
+    ]},
+    ADDR_B: {"txs": [
+        {"hash": TX_2,
+         "inputs": [{"prev_out": {"addr": ADDR_C, "value": 9}}],
+         "out": [{"addr": ADDR_B, "value": 8}]},
+        {"hash": TX_1,
+         "inputs": [{"prev_out": {"addr": ADDR_B, "value": 5}}],
+         "out": [{"addr": ADDR_A, "value": 4}]}
+    ]},
+}
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in for blockchain.info bodies"""
+
+    def __init__(self, data):
+        self.status_code = 200
+        self.content = json.dumps(data).encode()
+        self.headers = {}
+        self._data = data
+
+    @property
+    def raw(self):
+        return io.BytesIO(self.content)
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeSession:
+    """Serves ADDRESS_DATA and records the requested URLs"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.requests.append(url)
+        return FakeResponse(ADDRESS_DATA[url.rsplit("/", 1)[1]])
+
+
+class TestGraphBuild(unittest.TestCase):
+    """Test graph construction from blockchain.info transactions"""
+
+    def test_add_transactions(self):
+        """Test nodes and edges are added once per id"""
+        nodes, edges = {}, {}
+        txs = ADDRESS_DATA[ADDR_B]["txs"]
+
+        self.assertEqual(add_transactions(txs, nodes, edges), (2, 2))
+        self.assertEqual(add_transactions(txs, nodes, edges), (2, 2))
+
+        self.assertEqual(set(nodes), {TX_1, TX_2, ADDR_A, ADDR_B, ADDR_C})
+        self.assertEqual(nodes[TX_1]["type"], "transaction")
+        self.assertEqual(edges[f"{ADDR_C}->{TX_2}"]["value"], 9)
+        self.assertEqual(len(edges), 4)
+
+    def test_two_hop_merge(self):
+        """Test hops=2 merges counterparty transactions without duplicates"""
+        fetcher = BlockchainComFetcher(FetcherConfig(rate_limit_s=0.001), session=FakeSession())
+
+        one_hop = fetcher.build_graph_for_address(ADDR_A)
+        two_hop = fetcher.build_graph_for_address(ADDR_A, hops=2)
+
+        self.assertEqual({n["id"] for n in one_hop["nodes"]}, {ADDR_A, ADDR_B, TX_1})
+        self.assertEqual({n["id"] for n in two_hop["nodes"]}, {ADDR_A, ADDR_B, ADDR_C, TX_1, TX_2})
+        edge_ids = [e["id"] for e in two_hop["edges"]]
+        self.assertEqual(len(edge_ids), len(set(edge_ids)))
+        self.assertEqual(two_hop["meta"]["edge_count"], 4)
+        self.assertEqual(two_hop["meta"]["tx_count"], 3)
+
+
+class FakeGephiDriver:
+    """Returns the given records from session.run"""
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+
+    def session(self, **kwargs):
+        driver = self
+
+        class Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                pass
+
+            def run(self, query, **params):
+                driver.queries.append(query)
+                return driver.records
+
+        return Session()
+
+
+class TestGephiExport(unittest.TestCase):
+    """Test streamed GEXF export"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmp.name, "network.gexf")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_export_keeps_edge_attributes(self):
+        """Test the GEXF parses and carries value, type and timestamp"""
+        records = [{'source': ADDR_A, 'target': ADDR_B, 'tx_hash': TX_1,
+                    'value': 5, 'timestamp': '2024-01-01T00:00:00Z'}]
+
+        result = GephiExporter(FakeGephiDriver(records)).export_to_gephi(self.output)
+
+        self.assertEqual(result, self.output)
+        graph = nx.read_gexf(self.output)
+        self.assertEqual(graph.number_of_nodes(), 3)
+        edge = graph.edges[ADDR_A, TX_1]
+        self.assertEqual(edge['value'], 5.0)
+        self.assertEqual(edge['type'], 'PARTICIPATED_IN')
+        self.assertEqual(edge['timestamp'], '2024-01-01T00:00:00Z')
+
+    def test_subgraph_depth_and_node_cap(self):
+        """Test depth sets the traversal bound and max_nodes caps distinct nodes"""
+        records = [{'source': ADDR_A, 'target': ADDR_B, 'tx_hash': TX_1, 'value': 5},
+                   {'source': ADDR_B, 'target': ADDR_A, 'tx_hash': TX_1, 'value': 5},
+                   {'source': ADDR_B, 'target': ADDR_C, 'tx_hash': TX_2, 'value': 9}]
+        driver = FakeGephiDriver(records)
+
+        result = GephiExporter(driver).export_address_subgraph(
+            ADDR_A, depth=3, output_file=self.output, max_nodes=4)
+
+        self.assertEqual(result, self.output)
+        self.assertIn("[:PARTICIPATED_IN*0..4]", driver.queries[0])
+        graph = nx.read_gexf(self.output)
+        self.assertEqual(set(graph.nodes), {ADDR_A, ADDR_B, TX_1})
+        self.assertTrue(graph.has_edge(TX_1, ADDR_A))
+
+    def test_failed_stream_leaves_no_file(self):
+        """Test a mid-stream driver error leaves no partial output"""
+        def records():
+            yield {'source': ADDR_A, 'target': ADDR_B, 'tx_hash': TX_1, 'value': 5}
+            raise RuntimeError("connection lost")
+
+        result = GephiExporter(FakeGephiDriver(records())).export_to_gephi(self.output)
+
+        self.assertEqual(result, "")
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+class TestApi(unittest.TestCase):
+    """Test API routes as served by the app"""
+
+    @classmethod
+    def setUpClass(cls):
+        from src import api
+        cls.api = api
+        cls.client = api.app.test_client()
+
+    def test_invalid_address_rejected_before_fetch(self):
+        """Test a malformed address gets a 400 without touching the fetcher"""
+        with mock.patch.object(self.api, "get_fetcher") as get_fetcher:
+            response = self.client.post(
+                "/api/graph/address", json={"address": "not-an-address", "tx_limit": 10})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Invalid Bitcoin address format")
+        get_fetcher.assert_not_called()
+
+
+    def test_graph_streamed_with_etag(self):
+        """Test a saved graph is sent verbatim, 304 on revalidation, 404 if missing"""
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(self.api, "GRAPH_DIR_ABS", tmp):
+            Path(tmp, "graph.json").write_text('{"nodes":[]}')
+
+            response = self.client.get("/api/graph/get?name=graph.json")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_data(), b'{"nodes":[]}')
+            etag = response.headers["ETag"]
+            response.close()
+
+            response = self.client.get("/api/graph/get?name=graph.json",
+                                       headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 304)
+
+            response = self.client.get("/api/graph/get?name=missing.json")
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.get_json()["error"], "Graph not found")
+
+
+    def test_fetched_graph_saved_compact(self):
+        """Test the served route writes the fetched graph as compact JSON"""
+        graph = {"nodes": [{"id": ADDR_A}], "edges": [], "meta": {"address": ADDR_A}}
+        fetcher = mock.Mock()
+        fetcher.build_graph_for_address.return_value = graph
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(self.api, "GRAPH_DIR", Path(tmp)), \
+                mock.patch.object(self.api, "get_fetcher", return_value=fetcher):
+            response = self.client.post(
+                "/api/graph/address", json={"address": ADDR_A, "tx_limit": 10})
+
+            self.assertEqual(response.status_code, 200)
+            body = Path(tmp, response.get_json()["file"]).read_text()
+        self.assertEqual(json.loads(body), graph)
+        self.assertNotIn(" ", body)
+        self.assertNotIn("\n", body)
+
+
+    def test_graph_listing_refreshes_after_ttl(self):
+        """Test a change hidden from the directory stat shows up after the TTL"""
+        def listed():
+            return self.client.get("/api/graph/list").get_json()["files"]
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(self.api, "GRAPH_DIR", Path(tmp)), \
+                mock.patch.object(self.api.time, "monotonic", return_value=100.0) as monotonic:
+            self.api._list_graph_files.cache_clear()
+            self.assertEqual(listed(), [])
+
+            # Same-tick write on a coarse-mtime filesystem: the stat is unchanged
+            st = os.stat(tmp)
+            Path(tmp, "graph.json").write_text("{}")
+            os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.assertEqual(listed(), [])
+
+            monotonic.return_value += self.api.GRAPH_LIST_TTL_S
+            self.assertEqual(listed(), ["graph.json"])
+        self.api._list_graph_files.cache_clear()
+
+
+    def test_graph_name_traversal_rejected(self):
+        """Test graph names cannot escape the graph directory"""
+        response = self.client.get("/api/graph/get?name=../../etc/passwd")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Invalid graph name")
+
+
+    def test_fetcher_shared_across_requests(self):
+        """Test consecutive fetches reuse one BlockchainComFetcher"""
+        graph = {"nodes": [{"id": ADDR_A}], "edges": []}
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(self.api, "GRAPH_DIR", Path(tmp)), \
+                mock.patch.object(self.api, "_fetcher_instance", None), \
+                mock.patch.object(self.api, "BlockchainComFetcher") as fetcher_cls:
+            fetcher_cls.return_value.build_graph_for_address.return_value = graph
+            for _ in range(2):
+                response = self.client.post(
+                    "/api/graph/address", json={"address": ADDR_A, "tx_limit": 10})
+                self.assertEqual(response.status_code, 200)
+
+        fetcher_cls.assert_called_once_with()
+        self.assertEqual(fetcher_cls.return_value.build_graph_for_address.call_count, 2)
+
+
+    @unittest.skipUnless(IJSON_AVAILABLE, "ijson not installed")
+    def test_large_graph_upload_streams_node_ids(self):
+        """Test a large check-graph body is parsed incrementally for node ids"""
+        ids = [f"addr{i:06d}" for i in range(3000)]
+        body = json.dumps({"graph_data": {
+            "nodes": [{"id": node_id, "label": "x" * 20} for node_id in ids],
+            "edges": []}}).encode()
+        self.assertGreaterEqual(len(body), STREAMING_JSON_MIN_BYTES)
+        chainbreak = mock.Mock()
+        chainbreak.check_illicit_addresses_in_graph.return_value = {"illicit": []}
+
+        with mock.patch.object(self.api, "get_chainbreak", return_value=chainbreak):
+            response = self.client.post(
+                "/api/threat-intelligence/check-graph", data=body,
+                content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        chainbreak.check_illicit_addresses_in_graph.assert_called_once_with(
+            {"nodes": [{"id": node_id} for node_id in ids]})
+
+    @unittest.skipUnless(IJSON_AVAILABLE, "ijson not installed")
+    def test_large_upload_without_graph_data_rejected(self):
+        """Test a large check-graph body lacking graph_data gets a 400"""
+        body = json.dumps({"nodes": [{"id": f"addr{i:06d}"} for i in range(8000)]}).encode()
+        self.assertGreaterEqual(len(body), STREAMING_JSON_MIN_BYTES)
+
+        with mock.patch.object(self.api, "get_chainbreak") as get_chainbreak:
+            response = self.client.post(
+                "/api/threat-intelligence/check-graph", data=body,
+                content_type="application/json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Graph data required")
+        get_chainbreak.assert_not_called()
+
+    def test_oversized_body_rejected(self):
+        """Test bodies over MAX_CONTENT_LENGTH get a JSON 413"""
+        with mock.patch.dict(self.api.app.config, {'MAX_CONTENT_LENGTH': 100}):
+            response = self.client.post(
+                "/api/louvain", data=b"x" * 200, content_type="application/json")
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.get_json(),
+                         {"success": False, "error": "Request body too large"})
+
+
+class TestFetcherCache(unittest.TestCase):
+    """Test the fetcher's lazy LRU response cache"""
+
+    def setUp(self):
+        self.fetcher = BlockchainComFetcher(
+            FetcherConfig(max_cache_size=4, cache_ttl=300), session=FakeSession())
+
+    def test_lru_eviction(self):
+        """Test the cache trims to max size, keeping recently used entries"""
+        keys = [self.fetcher._get_cache_key("url", {"i": i}) for i in range(9)]
+        for i, key in enumerate(keys[:8]):
+            self.fetcher._cache_response(key, {"i": i})
+        # Touch the oldest entry so it survives the eviction pass
+        self.assertEqual(self.fetcher._get_cached_response(keys[0]), {"i": 0})
+
+        self.fetcher._cache_response(keys[8], {"i": 8})
+
+        self.assertEqual(self.fetcher.get_cache_stats()["cache_size"], 4)
+        self.assertIsNotNone(self.fetcher._get_cached_response(keys[0]))
+        self.assertIsNotNone(self.fetcher._get_cached_response(keys[8]))
+        self.assertIsNone(self.fetcher._get_cached_response(keys[1]))
+
+    def test_expired_entries_evicted_first(self):
+        """Test expired entries are dropped before live LRU entries"""
+        keys = [self.fetcher._get_cache_key("url", {"i": i}) for i in range(9)]
+        for i, key in enumerate(keys[:8]):
+            self.fetcher._cache_response(key, {"i": i})
+        # Expire the most recently used entry
+        tick, _, data = self.fetcher._cache[keys[7]]
+        self.fetcher._cache[keys[7]] = (tick, 0.0, data)
+
+        self.fetcher._cache_response(keys[8], {"i": 8})
+
+        self.assertNotIn(keys[7], self.fetcher._cache)
+        self.assertIn(keys[6], self.fetcher._cache)
+        self.assertIsNone(self.fetcher._get_cached_response(keys[0]))
+
+    def test_graph_build_served_from_cache(self):
+        """Test a repeat graph build does not hit the API again"""
+        first = self.fetcher.build_graph_for_address(ADDR_A)
+        second = self.fetcher.build_graph_for_address(ADDR_A)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.fetcher.session.requests), 1)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the fetcher's token bucket rate limiter"""
+
+    def test_burst_then_wait(self):
+        """Test a full bucket admits a burst, then callers wait for refill"""
+        fetcher = BlockchainComFetcher(FetcherConfig(rate_limit_s=0.25), session=FakeSession())
+        with mock.patch("src.fetch_blockchain_com.time.monotonic", return_value=fetcher._last_refill), \
+                mock.patch("src.fetch_blockchain_com.time.sleep") as sleep:
+            for _ in range(4):
+                fetcher._rate_limit_wait()
+            sleep.assert_not_called()
+
+            fetcher._rate_limit_wait()
+            fetcher._rate_limit_wait()
+
+        waits = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        self.assertAlmostEqual(waits[0], 0.25)
+        self.assertAlmostEqual(waits[1], 0.5)
+
+
+def _old_volume_risk(balance, total_received):
+    """Volume ladder as it was before banding"""
+    if balance > 0:
+        volume_ratio = total_received / balance
+        if volume_ratio > 20:
+            return 0.95
+        elif volume_ratio > 10:
+            return 0.85
+        elif volume_ratio > 5:
+            return 0.7
+        elif volume_ratio > 2:
+            return 0.5
+        return 0.3
+    if total_received > 1000000000:
+        return 0.8
+    elif total_received > 100000000:
+        return 0.6
+    elif total_received > 10000000:
+        return 0.4
+    return 0.2
+
+
+def _old_frequency_risk(total_tx_count):
+    if total_tx_count > 1000:
+        return 0.9
+    elif total_tx_count > 500:
+        return 0.8
+    elif total_tx_count > 100:
+        return 0.6
+    elif total_tx_count > 50:
+        return 0.4
+    return 0.2
+
+
+def _old_layering_risk(layering_count):
+    if layering_count > 10:
+        return 0.95
+    elif layering_count > 5:
+        return 0.8
+    elif layering_count > 2:
+        return 0.6
+    elif layering_count > 0:
+        return 0.4
+    return 0.1
+
+
+def _old_temporal_risk(rapid_sequences):
+    if rapid_sequences > 10:
+        return 0.8
+    elif rapid_sequences > 5:
+        return 0.6
+    elif rapid_sequences > 0:
+        return 0.4
+    return 0.1
+
+
+def _old_smurfing_risk(tx_count):
+    if tx_count > 20:
+        return 0.9
+    elif tx_count > 10:
+        return 0.7
+    return 0.5
+
+
+def _old_risk_level(score):
+    if score >= 0.8:
+        return "CRITICAL"
+    elif score >= 0.6:
+        return "HIGH"
+    elif score >= 0.4:
+        return "MEDIUM"
+    elif score >= 0.2:
+        return "LOW"
+    return "VERY_LOW"
+
+
+class TestRiskBanding(unittest.TestCase):
+    """Test bisect banding matches the original if/elif ladders"""
+
+    def setUp(self):
+        self.scorer = RiskScorer(None, {'risk_scoring': {}})
+
+    def test_count_factors(self):
+        """Test integer-count factors at and around every threshold"""
+        for count in range(0, 1100):
+            with self.subTest(count=count):
+                self.assertEqual(
+                    self.scorer._calculate_frequency_risk({'transaction_count': count}),
+                    _old_frequency_risk(count))
+                self.assertEqual(RiskScorer._layering_score(count), _old_layering_risk(count))
+                self.assertEqual(RiskScorer._temporal_score(count), _old_temporal_risk(count))
+                if count >= 5:  # the smurfing query only returns tx_count >= 5
+                    self.assertEqual(RiskScorer._smurfing_score({'tx_count': count}),
+                                     _old_smurfing_risk(count))
+        self.assertEqual(RiskScorer._smurfing_score(None), 0.1)
+
+    def test_volume_factor(self):
+        """Test volume banding on ratio and absolute thresholds"""
+        for balance, total_received in [
+                (1, 0), (1, 2), (1, 2.0001), (1, 5), (1, 5.5), (1, 10), (1, 11),
+                (1, 20), (1, 21), (0, 0), (0, 10000000), (0, 10000001),
+                (0, 100000000), (0, 100000001), (0, 1000000000), (0, 1000000001)]:
+            with self.subTest(balance=balance, total_received=total_received):
+                self.assertEqual(
+                    self.scorer._calculate_volume_risk(
+                        {'balance': balance, 'total_received': total_received}),
+                    _old_volume_risk(balance, total_received))
+
+    def test_risk_levels(self):
+        """Test level classification is inclusive at each lower bound"""
+        for score in np.linspace(0.0, 1.0, 101).tolist() + [0.2, 0.4, 0.6, 0.8, 0.19999, 0.79999]:
+            with self.subTest(score=score):
+                self.assertEqual(self.scorer._classify_risk_level(score), _old_risk_level(score))
+
+
+class FakeRiskSession:
+    """Answers the batched risk queries with neo4j Records, as the driver does"""
+
+    INFO = {ADDR_A: {'address': ADDR_A, 'balance': 10, 'total_received': 300, 'total_sent': 0}}
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def run(self, query, **params):
+        self.calls.append(query)
+        return [Record(row.items()) for row in self._rows(query, params.get('addresses', []))]
+
+    def _rows(self, query, addresses):
+        if 'layering_count' in query:
+            return [{'addr': a, 'layering_count': 3} for a in addresses]
+        if 'unique_receivers' in query:
+            return [{'addr': a, 'tx_count': 6, 'unique_receivers': 6} for a in addresses]
+        if 'rapid_sequences' in query:
+            return []
+        return [self.INFO[a] for a in addresses if a in self.INFO]
+
+    def execute_read(self, fn, *args):
+        return fn(self, *args)
+
+
+class FakeRiskDriver:
+    def __init__(self):
+        self.calls = []
+
+    def session(self, **kwargs):
+        return FakeRiskSession(self.calls)
+
+
+class TestRiskScoreCache(unittest.TestCase):
+    """Test batched risk scoring and its per-address cache"""
+
+    def setUp(self):
+        self.driver = FakeRiskDriver()
+        self.scorer = RiskScorer(self.driver, {'risk_scoring': {}})
+
+    def test_batch_uses_one_query_per_factor(self):
+        """Test a summary issues one query per factor, not per address"""
+        summary = self.scorer.get_risk_summary([ADDR_A, ADDR_B, ADDR_A])
+
+        # Repeats are reported per request but scored once
+        self.assertEqual(summary['total_addresses'], 3)
+        self.assertEqual(summary['risk_scores'][0], summary['risk_scores'][2])
+        self.assertEqual(len(self.driver.calls), 4)
+
+    def test_cached_results_are_copies(self):
+        """Test annotating a returned result does not change the cache"""
+        first = self.scorer.calculate_address_risk_score(ADDR_A)
+        factors = dict(first['risk_factors'])
+        first['note'] = 'annotated'
+        first['risk_factors']['volume_risk'] = -1
+        calls = len(self.driver.calls)
+
+        second = self.scorer.calculate_address_risk_score(ADDR_A)
+
+        self.assertNotIn('note', second)
+        self.assertEqual(second['risk_factors'], factors)
+        self.assertEqual(second['total_risk_score'], first['total_risk_score'])
+        self.assertEqual(len(self.driver.calls), calls)
+
+    def test_invalidate(self):
+        """Test invalidation forces a recompute"""
+        self.scorer.calculate_address_risk_score(ADDR_A)
+        self.scorer.invalidate_cache(ADDR_A)
+        calls = len(self.driver.calls)
+
+        self.scorer.calculate_address_risk_score(ADDR_A)
+
+        self.assertGreater(len(self.driver.calls), calls)
+
+    def test_results_hold_plain_dicts(self):
+        """Test driver Records are converted before reaching results or the cache"""
+        result = self.scorer.calculate_address_risk_score(ADDR_A)
+
+        self.assertIs(type(result['address_info']), dict)
+        self.assertEqual(result['address_info']['total_received'], 300)
+        self.assertNotEqual(result['risk_details']['smurfing_risk'], 0.1)
+
+
+class TestLouvainGrouping(unittest.TestCase):
+    """Test community bucketing for Louvain results"""
+
+    def test_group_by_community(self):
+        """Test grouping keeps member and first-appearance community order"""
+        from src.test_louvain_simple import _group_by_community
+
+        node_ids = ["n0", "n1", "n2", "n3", "n4", "n5"]
+        membership = np.array([2, 0, 2, 1, 0, 2])
+
+        communities = _group_by_community(node_ids, membership)
+
+        self.assertEqual(list(communities.items()), [
+            (2, ["n0", "n2", "n5"]), (0, ["n1", "n4"]), (1, ["n3"])])
+        self.assertEqual(_group_by_community([], np.array([], dtype=np.int64)), {})
+
+    def test_fast_path_shape(self):
+        """Test run_louvain_fast covers every node once"""
+        from src import test_louvain_simple
+
+        graph = nx.gnm_random_graph(200, 600, seed=1)
+        graph_data = {
+            'nodes': [{'id': f"n{n}"} for n in graph],
+            'edges': [{'source': f"n{u}", 'target': f"n{v}"} for u, v in graph.edges()]
+        }
+        with mock.patch.object(test_louvain_simple, 'FAST_LOUVAIN_MIN_EDGES', 0):
+            results = test_louvain_simple.run_louvain_fast(graph_data)
+
+        members = [m for group in results['communities'].values() for m in group]
+        self.assertEqual(sorted(members), sorted(results['partition']))
+        self.assertEqual(results['num_communities'], len(results['communities']))
+
+    def test_igraph_engine_skips_networkx_build(self):
+        """Test engine='igraph' returns no graph and never builds one"""
+        from src import test_louvain_simple
+
+        graph_data = {
+            'nodes': [{'id': "a"}, {'id': "b"}, {'id': "c"}],
+            'edges': [{'source': "a", 'target': "b"}, {'source': "b", 'target': "c"}]
+        }
+        with mock.patch.object(test_louvain_simple, 'IGRAPH_AVAILABLE', True), \
+                mock.patch.object(test_louvain_simple, '_louvain_igraph',
+                                  return_value=(np.array([5, 5, 7]), 0.1)), \
+                mock.patch.object(test_louvain_simple, '_build_nx_graph') as build:
+            results = test_louvain_simple.run_louvain_algorithm(graph_data, engine='igraph')
+
+        build.assert_not_called()
+        self.assertNotIn('graph', results)
+        self.assertEqual(results['partition'], {"a": 0, "b": 0, "c": 1})
+        self.assertEqual(results['communities'], {0: ["a", "b"], 1: ["c"]})
+
+
+if __name__ == '__main__':
+    unittest.main()